@@ -32,6 +32,10 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p.add_argument("--replicas-min", type=int, help="Minimum replicas (overrides config file)")
     p.add_argument("--replicas-max", type=int, help="Maximum replicas (overrides config file)")
     p.add_argument("--watch", action="store_true", help="Watch files and revalidate on change")
+    p.add_argument("--watch-backend", choices=["watchdog", "watchfiles"], default="watchdog",
+                   help="File watching backend (watchfiles needs the 'watch' extra)")
+    p.add_argument("--processes", action="store_true",
+                   help="Run validation rules in a process pool (for CPU-heavy rule sets)")
     p.add_argument("--verbose", action="store_true", help="Verbose logging")
 
     return p.parse_args(argv)
@@ -48,21 +52,25 @@ def main(argv: list[str] | None = None) -> int:
         storage_config_path=args.storage_config,
         replicas_min=args.replicas_min,
         replicas_max=args.replicas_max,
+        use_processes=args.processes,
     )
 
-    if args.watch:
-        try:
-            validation_service.run_validation()
-        except Exception as e:
-            logger.error("Validation failed: %s", e)
-            return 1
-        
-        watch_with_validation_service(validation_service)
-        return 0
-    else:
-        try:
-            validation_service.run_validation()
+    try:
+        if args.watch:
+            try:
+                validation_service.run_validation()
+            except Exception as e:
+                logger.error("Validation failed: %s", e)
+                return 1
+            
+            watch_with_validation_service(validation_service, backend=args.watch_backend)
             return 0
-        except Exception as e:
-            logger.error("Validation failed: %s", e)
-            return 1
\ No newline at end of file
+        else:
+            try:
+                validation_service.run_validation()
+                return 0
+            except Exception as e:
+                logger.error("Validation failed: %s", e)
+                return 1
+    finally:
+        validation_service.close()
\ No newline at end of file
@@ -3,116 +3,107 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from dataclasses import asdict
-from typing import Any, List
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Awaitable, List, Optional
 
-from .base_validator import BaseValidator, ValidationResult
-from .types import ValidationIssue
+from .base_validator import ValidationResult
+from .rules_loader import load_rules
+from .validator import Validator, ValidatorCore
 
 logger = logging.getLogger(__name__)
 
+_WORKER_VALIDATOR: Validator | None = None
 
-class AsyncValidator(BaseValidator):
+
+def _worker_init(config: Any, storage: Any) -> None:
+    """Process-pool initializer: import the rules and build one validator per worker."""
+    global _WORKER_VALIDATOR
+    load_rules()
+    _WORKER_VALIDATOR = Validator(config, storage, max_concurrency=1)
+
+
+def _validate_chunk_in_worker(file_paths: List[str]) -> List[ValidationResult]:
+    validator = _WORKER_VALIDATOR
+    if validator is None:
+        raise RuntimeError("process-pool worker was not initialized")
+    return validator._validate_chunk_sync(file_paths, cached=False)
+
+
+class AsyncValidator(ValidatorCore):
     def __init__(
         self,
         config: Any,
         storage: Any,
         max_concurrency: int | None = None,
         per_task_timeout: float | None = 30.0,
+        chunk_size: int = 32,
+        use_processes: bool = False,
     ) -> None:
-        super().__init__(config, storage)
-        self._max_concurrency = max_concurrency or min(32, (os.cpu_count() or 4) * 2)
-        self._timeout = per_task_timeout
+        super().__init__(config, storage, max_concurrency, per_task_timeout, chunk_size)
+        self._use_processes = use_processes
 
-    async def _validate_one_async(self, file_path: str) -> ValidationResult:
-        return await asyncio.to_thread(self._validate_one_sync, file_path)
+    def _new_pool(self) -> Executor:
+        if not self._use_processes:
+            return super()._new_pool()
+        # Rules are pure-Python and hold the GIL, so CPU-heavy rule sets scale with processes.
+        return ProcessPoolExecutor(
+            max_workers=min(self._max_concurrency, os.cpu_count() or 1),
+            initializer=_worker_init,
+            initargs=(self.config, self.storage),
+        )
 
-    def _validate_one_sync(self, file_path: str) -> ValidationResult:
-        data, errors = self._read_and_parse_file(file_path)
-        
-        issues: List[ValidationIssue] = []
-        for err in errors:
-            issues.append(ValidationIssue(
-                rule_id="file.parse_error",
-                message=err,
-                keywords=["parse", "error"]
-            ))
-        
-        registry = None
-        if data is None:
-            return ValidationResult(
-                path=file_path,
-                valid=False,
-                errors=errors,
-                issues=[asdict(issue) for issue in issues],
-                registry=None,
-                data=None
-            )
+    async def _validate_chunk_in_processes(self, file_paths: List[str]) -> List[ValidationResult]:
+        # The result cache lives in this process, so lookups and stores happen here, not in workers.
+        fingerprints = [self._file_fingerprint(path) for path in file_paths]
+        results: List[Optional[ValidationResult]] = [
+            self._cached_result(path, fp) for path, fp in zip(file_paths, fingerprints)
+        ]
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return [result for result in results if result is not None]
         
-        if isinstance(data, dict):
-            rule_issues = self._run_validation_rules(data, file_path)
-            issues.extend(rule_issues)
-            registry = self._extract_registry(data)
-        
-        for issue in issues:
-            self._build_search_keys(issue, data, registry)
-        
-        valid = len(issues) == 0
-        errors = [issue.message for issue in issues]
-        
-        return ValidationResult(
-            path=file_path,
-            valid=valid,
-            errors=errors,
-            issues=[asdict(issue) for issue in issues],
-            registry=registry,
-            data=data
+        loop = asyncio.get_running_loop()
+        fresh = await loop.run_in_executor(
+            self._get_pool(), _validate_chunk_in_worker, [file_paths[i] for i in misses]
         )
+        for i, result in zip(misses, fresh):
+            results[i] = result
+            fingerprint = fingerprints[i]
+            if fingerprint is not None:
+                self._store_result(file_paths[i], fingerprint, None, result)
+        return [result for result in results if result is not None]
 
-    async def validate_file(self, file_path: str) -> ValidationResult:
+    async def _validate_chunk(self, file_paths: List[str]) -> List[ValidationResult]:
+        future: Awaitable[List[ValidationResult]]
+        if self._use_processes:
+            future = self._validate_chunk_in_processes(file_paths)
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._get_pool(), self._validate_chunk_sync, file_paths)
         try:
             if self._timeout:
-                return await asyncio.wait_for(
-                    self._validate_one_async(file_path),
-                    timeout=self._timeout
-                )
+                return await asyncio.wait_for(future, timeout=self._timeout)
             else:
-                return await self._validate_one_async(file_path)
+                return await future
         except asyncio.TimeoutError:
-            logger.error(f"Timeout validating {file_path}")
-            timeout_issue = ValidationIssue(
-                rule_id="file.timeout",
-                message="TIMEOUT",
-                keywords=["timeout", "error"]
-            )
-            return ValidationResult(
-                path=file_path,
-                valid=False,
-                errors=["TIMEOUT"],
-                issues=[asdict(timeout_issue)],
-                registry=None,
-                data=None
-            )
+            return self._chunk_timeout_results(file_paths)
         except Exception as e:
-            logger.error(f"Error validating {file_path}: {e}")
-            error_issue = ValidationIssue(
-                rule_id="file.error",
-                message=repr(e),
-                keywords=["error"]
-            )
-            return ValidationResult(
-                path=file_path,
-                valid=False,
-                errors=[repr(e)],
-                issues=[asdict(error_issue)],
-                registry=None,
-                data=None
-            )
+            return self._chunk_error_results(file_paths, e)
+
+    async def validate_file(self, file_path: str) -> ValidationResult:
+        return (await self._validate_chunk([file_path]))[0]
 
     async def validate_files(self, file_paths: List[str]) -> List[ValidationResult]:
-        sem = asyncio.Semaphore(self._max_concurrency)
-        tasks = [asyncio.create_task(self.validate_file(path)) for path in file_paths]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        size = self._chunk_len(len(file_paths))
+        chunks = [file_paths[i:i + size] for i in range(0, len(file_paths), size)]
+        chunk_results = await asyncio.gather(*(self._validate_chunk(chunk) for chunk in chunks))
+        return [result for chunk in chunk_results for result in chunk]
+
+    def validate_many(self, file_paths: List[str]) -> List[ValidationResult]:
+        if self._use_processes:
+            # Cache lookups and stores stay in this process; see _validate_chunk_in_processes.
+            return asyncio.run(self.validate_files(file_paths))
+        return super().validate_many(file_paths)
 
     def validate_files_sync(self, file_paths: List[str]) -> List[ValidationResult]:
-        return asyncio.run(self.validate_files(file_paths))
\ No newline at end of file
+        return self.validate_many(file_paths)
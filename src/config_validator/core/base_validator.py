@@ -1,90 +1,212 @@
 from __future__ import annotations
 
+import copy
+import hashlib
 import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
-from typing import Any, Callable, Dict, List
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
 
 import yaml
 
 from ..storage.local_strategy import LocalStrategy
-from .config import ValidationConfig
-from .rules_loader import load_rules
+from ..utils.hashing import RACY_WINDOW_NS
+from ..utils.serialization import dumps
+from .config import ValidationConfig, YamlLoader
+from .rules_loader import ValidatorFn, bind_rules, load_rules
 from .types import ValidationIssue
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+_PARSE_CACHE_MAX_BYTES = 64 * 1024
+_PARSE_CACHE_SIZE = 128
+_MISS = object()
+_parse_cache: OrderedDict[bytes, Any] = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _load_yaml(content: bytes) -> Any:
+    if len(content) > _PARSE_CACHE_MAX_BYTES:
+        return yaml.load(content, Loader=YamlLoader)
+    with _parse_cache_lock:
+        tree = _parse_cache.get(content, _MISS)
+        if tree is not _MISS:
+            _parse_cache.move_to_end(content)
+    if tree is not _MISS:
+        # Identical small files (per-environment copies, reverted edits) parse once; later ones
+        # get a deep copy of the cached tree, which is still ~10x cheaper than re-parsing.
+        return copy.deepcopy(tree)
+    
+    # A miss hands out the freshly parsed tree itself, so distinct files pay nothing extra.
+    # Validation never mutates parsed data, which makes sharing it with the cache safe.
+    tree = yaml.load(content, Loader=YamlLoader)
+    with _parse_cache_lock:
+        _parse_cache[content] = tree
+        if len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return tree
+
+
+@dataclass(slots=True)
 class ValidationResult:
     path: str
     valid: bool
-    errors: List[str]
-    issues: List[Dict[str, Any]]
+    issues: List[ValidationIssue]
     registry: str | None
     data: Dict[str, Any] | None
+    sha256: str | None = None
+    _errors: List[str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def errors(self) -> List[str]:
+        """Issue messages, kept for backward compatibility; built on first access."""
+        if self._errors is None:
+            self._errors = [issue.message for issue in self.issues]
+        return self._errors
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "valid": self.valid,
+            "issues": [issue.to_dict() for issue in self.issues],
+            "registry": self.registry,
+            "data": self.data,
+            "sha256": self.sha256,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> ValidationResult:
+        return cls(
+            path=d["path"],
+            valid=d["valid"],
+            issues=[ValidationIssue(**issue) for issue in d["issues"]],
+            registry=d["registry"],
+            data=d["data"],
+            sha256=d.get("sha256"),
+        )
 
 
 class BaseValidator(ABC):
     def __init__(self, config: ValidationConfig, storage: LocalStrategy) -> None:
         self.config = config
         self.storage = storage
-        self._validators: List[Callable] | None = None
+        # Rules bound here read the config as it is now; a changed config needs a new validator
+        self._validators: tuple[ValidatorFn, ...] = bind_rules(load_rules(), config)
+        # path -> (mtime_ns, size, content digest, result); lets unchanged files skip parsing and
+        # rules entirely, and files whose mtime moved but bytes did not skip them after one read
+        # (a racily recent mtime is stored as None, see _store_result)
+        self.result_cache: Dict[str, tuple[int | None, int, int | None, ValidationResult]] = {}
     
     @property
-    def validators(self) -> List[Callable]:
-        if self._validators is None:
-            self._validators = load_rules()
+    def validators(self) -> tuple[ValidatorFn, ...]:
         return self._validators
     
+    def _cached_result(self, file_path: str, fingerprint: tuple[int, int] | None) -> ValidationResult | None:
+        if fingerprint is None:
+            return None
+        cached = self.result_cache.get(file_path)
+        if cached is not None and (cached[0], cached[1]) == fingerprint:
+            return cached[3]
+        return None
+    
+    def _store_result(
+        self,
+        file_path: str,
+        fingerprint: tuple[int, int],
+        digest: int | None,
+        result: ValidationResult,
+    ) -> None:
+        mtime_ns, size = fingerprint
+        # A file written within the racy window can change again without its (mtime, size)
+        # moving; keep no mtime for it so the next lookup misses and compares content digests.
+        self.result_cache[file_path] = (
+            mtime_ns if time.time_ns() - mtime_ns > RACY_WINDOW_NS else None,
+            size,
+            digest,
+            result,
+        )
+    
+    def _file_fingerprint(self, file_path: str) -> tuple[int, int] | None:
+        try:
+            return self.storage.fingerprint(file_path)
+        except OSError:
+            return None
+    
     def _read_and_parse_file(self, file_path: str) -> tuple[Dict[str, Any] | None, List[str]]:
-        errors: List[str] = []
-        
+        content, errors = self._read_content(file_path)
+        if content is None:
+            return None, errors
+        return self._parse_content(file_path, content)
+    
+    def _read_content(self, file_path: str) -> tuple[bytes | None, List[str]]:
         try:
-            content = self.storage.read_file(file_path)
+            return self.storage.read_bytes(file_path), []
         except Exception as e:
             return None, [f"Failed to read file {file_path}: {e}"]
+    
+    def _parse_content(self, file_path: str, content: bytes) -> tuple[Dict[str, Any] | None, List[str]]:
+        errors: List[str] = []
         
         try:
-            data = yaml.safe_load(content) or {}
+            data = _load_yaml(content)
         except yaml.YAMLError as e:
             return None, [f"YAML parse error in {file_path}: {e}"]
         except Exception as e:
             return None, [f"Error parsing YAML from {file_path}: {e}"]
         
+        return self._normalize_document(data), errors
+    
+    @staticmethod
+    def _normalize_document(data: Any) -> Any:
+        """Empty documents become {} and a top-level list of mappings is merged into one."""
+        data = data or {}
         if isinstance(data, list):
             d = {}
             for x in data:
                 if isinstance(x, dict):
                     d.update(x)
             data = d
-        
-        return data, errors
+        return data
+    
+    @staticmethod
+    def _compute_sha256(data: Dict[str, Any] | None) -> str | None:
+        if not data:
+            return None
+        try:
+            return hashlib.sha256(dumps(data, sort_keys=True)).hexdigest()
+        except Exception:
+            return None
     
     def _extract_registry(self, data: Dict[str, Any]) -> str | None:
         img = data.get("image")
         if isinstance(img, str):
-            import re
-            m = re.compile(self.config.image_pattern).match(img)
+            m = self.config._image_re.match(img)
             if m:
-                return m.group("registry")
+                return sys.intern(m.group("registry"))
         return None
     
-    def _build_search_keys(self, issue: ValidationIssue, data: Dict[str, Any] | None, registry: str | None) -> None:
-        keys = [f"rule:{issue.rule_id}"]
+    def _common_search_keys(self, service: Any, registry: str | None) -> List[str]:
+        keys: List[str] = []
         
-        for k in issue.keywords:
-            keys.append(f"keyword:{k}")
-        
-        if data and isinstance(data, dict):
-            svc = data.get("service")
-            if svc:
-                keys.append(f"service:{svc}")
+        if service:
+            keys.append(f"service:{service}")
         
         if registry:
             keys.append(f"registry:{registry}")
         
-        issue.search_keys = sorted(set(keys))
+        return keys
+    
+    def _build_search_keys(self, issue: ValidationIssue, common_keys: List[str]) -> None:
+        issue.search_keys = sorted({
+            *common_keys,
+            f"rule:{issue.rule_id}",
+            *(f"keyword:{k}" for k in issue.keywords),
+        })
     
     def _run_validation_rules(self, data: Dict[str, Any], file_path: str) -> List[ValidationIssue]:
         issues: List[ValidationIssue] = []
@@ -101,8 +223,16 @@ class BaseValidator(ABC):
                     keywords=["error"]
                 ))
         
+        # rule ids and keywords repeat across thousands of issues; share one string object each
+        for issue in issues:
+            issue.rule_id = sys.intern(issue.rule_id)
+            issue.keywords = [sys.intern(k) for k in issue.keywords]
+        
         return issues
     
+    def close(self) -> None:
+        pass
+    
     @abstractmethod
     def validate_file(self, file_path: str) -> ValidationResult:
         pass
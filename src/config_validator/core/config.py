@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml bindings
+    from yaml import SafeLoader as _Loader
+
+YamlLoader = _Loader
+
 
 @dataclass
 class ValidationRule:
@@ -26,18 +34,20 @@ class ValidationConfig:
     required_fields: List[str] = None
     env_key_case: str = "UPPERCASE"   
     custom_rules: List[ValidationRule] = None
+    _image_re: re.Pattern[str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.required_fields is None:
             self.required_fields = ["service", "image", "replicas"]
         if self.custom_rules is None:
             self.custom_rules = []
+        self._image_re = re.compile(self.image_pattern)
 
 
 def load_validation_config(config_path: Optional[Path] = None) -> ValidationConfig:
     if config_path and config_path.exists():
         with config_path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=YamlLoader) or {}
         
         return ValidationConfig(
             replicas_min=data.get("replicas_min", 1),
@@ -12,5 +12,5 @@ class Discovery:
         self._storage_strategy = storage_strategy
 
     def discover_yaml_files(self, root: Path) -> Iterable[Path]:
-        return self._storage_strategy.get_yaml_files(root)
+        return self._storage_strategy.get_yaml_files(root, self._storage_strategy.walk_workers)
  
\ No newline at end of file
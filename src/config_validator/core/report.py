@@ -1,11 +1,11 @@
 from __future__ import annotations
-from collections import Counter
 from typing import Any, Dict, Iterable, List
 from datetime import datetime, timezone
 import hashlib
-import json
 
+from .base_validator import ValidationResult
 from ..utils.log_decorator import log_process
+from ..utils.serialization import dumps
 
 
 def utc_ts() -> str:
@@ -16,54 +16,56 @@ def compute_sha256(obj: Any) -> str | None:
     if obj is None:
         return None
     try:
-        payload = json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
-        return hashlib.sha256(payload).hexdigest()
+        return hashlib.sha256(dumps(obj, sort_keys=True)).hexdigest()
     except Exception:
         return None
 
 
 @log_process()
-def aggregate_and_summarize(results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+def aggregate_and_summarize(results: Iterable[ValidationResult]) -> Dict[str, Any]:
     run_id = utc_ts()
     now_ts = run_id
-    
-    results_list = list(results)
 
-    # Convert ValidationResult objects to dicts if needed
-    from dataclasses import asdict
-    converted_results = []
-    for r in results_list:
-        if hasattr(r, '__dict__') or hasattr(r, '_asdict'):
-            # It's likely a dataclass or namedtuple
-            converted_results.append(asdict(r))
-        else:
-            converted_results.append(r)
-    results_list = converted_results
+    valid_count = 0
+    invalid_count = 0
+    total_issues = 0
+    counts: Dict[str, int] = {}
+    c_rule: Dict[str, int] = {}
+    c_kw: Dict[str, int] = {}
+    results_list: List[Dict[str, Any]] = []
 
-    valid_count = sum(1 for r in results_list if r.get("valid"))
-    invalid_count = sum(1 for r in results_list if not r.get("valid"))
+    # Single pass: tally counts and build the per-file rows with their metadata
+    for r in results:
+        valid = r.valid
+        if valid:
+            valid_count += 1
+        else:
+            invalid_count += 1
 
-    registries = [r.get("registry") for r in results_list if r.get("registry")]
-    counts = dict(Counter(registries))
+        registry = r.registry
+        if registry:
+            counts[registry] = counts.get(registry, 0) + 1
 
-    total_issues = sum(len(r.get("errors", [])) for r in results_list)
+        total_issues += len(r.errors)
 
-    # inject metadata per-file
-    for r in results_list:
-        r["run_id"] = run_id
-        r["ts"] = now_ts
-        r["valid_int"] = 1 if r.get("valid") else 0
-        r["sha256"] = compute_sha256(r.get("data"))
+        for iss in r.issues:
+            rule_id = iss.rule_id
+            c_rule[rule_id] = c_rule.get(rule_id, 0) + 1
+            for k in iss.keywords:
+                c_kw[k] = c_kw.get(k, 0) + 1
 
-    # Count by rule and keyword
-    c_rule = Counter()
-    c_kw = Counter()
-    
-    for r in results_list:
-        for iss in r.get("issues", []):
-            c_rule[iss["rule_id"]] += 1
-            for k in iss.get("keywords", []):
-                c_kw[k] += 1
+        results_list.append({
+            "path": r.path,
+            "valid": valid,
+            "errors": r.errors,
+            "issues": r.issues,
+            "registry": registry,
+            "data": r.data,
+            "run_id": run_id,
+            "ts": now_ts,
+            "valid_int": 1 if valid else 0,
+            "sha256": r.sha256 if r.sha256 is not None else compute_sha256(r.data),
+        })
 
     report: Dict[str, Any] = {
         # "summary": {
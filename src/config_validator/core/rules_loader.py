@@ -1,27 +1,40 @@
 from __future__ import annotations
 import importlib
 import pkgutil
-from typing import Any, Callable, List
+from functools import lru_cache
+from typing import Any, Callable, List, Tuple
 
 _DEF_PKG = "config_validator.rules"
 ValidatorFn = Callable[[dict, Any], List]
 
 
-def load_rules(config=None) -> List[ValidatorFn]:
-    """Load all validator functions from the rules package."""
+@lru_cache(maxsize=1)
+def load_rules() -> Tuple[ValidatorFn, ...]:
+    """Load all validator functions from the rules package (scanned once per process)."""
     validators: List[ValidatorFn] = []
     pkg = importlib.import_module(_DEF_PKG)
-    
+
     for m in pkgutil.iter_modules(pkg.__path__, prefix=f"{_DEF_PKG}."):
         try:
             module = importlib.import_module(m.name)
-            for attr_name in dir(module):
-                if not attr_name.startswith('_'):
-                    attr = getattr(module, attr_name)
-                    # Find all functions that start with 'validate_'
-                    if callable(attr) and attr_name.startswith('validate_'):
-                        validators.append(attr)
         except Exception:
             continue
-    
-    return validators
\ No newline at end of file
+        # Find all functions that start with 'validate_'
+        validators.extend(
+            attr for attr_name, attr in vars(module).items()
+            if attr_name.startswith('validate_') and callable(attr)
+        )
+
+    return tuple(validators)
+
+
+def bind_rules(validators: Tuple[ValidatorFn, ...], config: Any) -> Tuple[ValidatorFn, ...]:
+    """Swap in per-config versions of the rules that provide one.
+
+    A rule may expose a ``specialize(config)`` attribute returning an equivalent validator with
+    the config values read once up front; it is called here, when a validator is built.
+    """
+    return tuple(
+        fn.specialize(config) if hasattr(fn, "specialize") else fn
+        for fn in validators
+    )
@@ -1,10 +1,29 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     rule_id: str
     message: str
     keywords: List[str] = field(default_factory=list)
     search_keys: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rule_id": self.rule_id,
+            "message": self.message,
+            "keywords": self.keywords,
+            "search_keys": self.search_keys,
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        # Issues used to be plain dicts; keep issue["message"] style access working.
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self.__dataclass_fields__:
+            return default
+        return getattr(self, key)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
+import contextlib
+import hashlib
 import logging
 import os
+import tempfile
 import threading
-import hashlib
 from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -12,21 +13,28 @@ from typing import Any, Iterable, List, Optional
 
 import yaml
 
-from .base_validator import BaseValidator, ValidationResult
-from .config import load_validation_config
+from .base_validator import ValidationResult
+from .config import YamlLoader, load_validation_config
 from .discovery import Discovery
 from .async_validator import AsyncValidator
+from .validator import ValidatorCore
+from .. import __version__
 from ..storage.strategy_loader import load_storage_strategy
+from ..utils.serialization import dumps, loads, write_json
 
 logger = logging.getLogger(__name__)
 
 
 def write_file_event(stream_fp, event: dict) -> None:
-    """Write a file event as a single compact JSON line to the stream."""
-    line = json.dumps(event, separators=(",", ":"), ensure_ascii=False)
-    stream_fp.write(line + '\n')
-    stream_fp.flush()
-    os.fsync(stream_fp.fileno())
+    """Write a file event as a single compact JSON line to a binary stream."""
+    stream_fp.write(dumps(event) + b'\n')
+
+
+def _run_timestamps() -> tuple[str, str]:
+    """Return (run_id, file_stamp) from a single clock read: UTC ISO id and local report stamp."""
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    run_id = now.isoformat().replace("+00:00", "Z")
+    return run_id, now.astimezone().strftime("%Y%m%d_%H%M%S")
 
 
 class ValidationService:
@@ -40,6 +48,7 @@ class ValidationService:
         replicas_max: int | None = None,
         max_concurrency: int | None = None,
         batch_size: int = 100,
+        use_processes: bool = False,
     ) -> None:
         self.root_path = root_path
         self.report_path = report_path
@@ -49,13 +58,17 @@ class ValidationService:
         self.replicas_max = replicas_max
         self.max_concurrency = max_concurrency
         self.batch_size = batch_size
+        self.use_processes = use_processes
 
         self._config = None
         self._storage_strategy = None
         self._discovery = None
-        self._validator: BaseValidator | None = None
+        self._validator: ValidatorCore | None = None
         
         self._write_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._stream_events: dict[str, bytes] | None = None
+        self._stream_dirty = False
 
     def _load_config(self) -> None:
         if self._config is None:
@@ -79,30 +92,103 @@ class ValidationService:
             self._load_storage_strategy()
             self._discovery = Discovery(self.root_path, self._storage_strategy)
 
-    def _setup_validator(self) -> None:
+    def _setup_validator(self) -> ValidatorCore:
         if self._validator is None:
             self._load_config()
             self._load_storage_strategy()
             
-            self._validator = AsyncValidator(
+            validator = self._validator = AsyncValidator(
                 config=self._config,
                 storage=self._storage_strategy,
-                max_concurrency=self.max_concurrency
+                max_concurrency=self.max_concurrency,
+                use_processes=self.use_processes,
             )
+            self._load_result_cache(validator)
+        return self._validator
+
+    def close(self) -> None:
+        if self._validator is not None:
+            self._validator.close()
+
+    def _cache_path(self) -> Path:
+        return self.report_path / "validation-cache.json"
+
+    def _cache_key(self, validator: ValidatorCore) -> str:
+        # Cached results are only reusable under the same config, rule set and package version.
+        rules = ",".join(fn.__qualname__ for fn in validator.validators)
+        return hashlib.sha256(f"{__version__}|{rules}|{self._config!r}".encode("utf-8")).hexdigest()
+
+    def _load_result_cache(self, validator: ValidatorCore) -> None:
+        cache_path = self._cache_path()
+        if not cache_path.exists():
+            return
+        try:
+            payload = loads(cache_path.read_bytes())
+            if payload.get("key") != self._cache_key(validator):
+                logger.info("Validation config changed; ignoring cached results in %s", cache_path)
+                return
+            validator.result_cache = {
+                path: (mtime_ns, size, digest, ValidationResult.from_dict(result))
+                for path, (mtime_ns, size, digest, result) in payload["entries"].items()
+            }
+            logger.debug("Loaded %d cached results from %s", len(validator.result_cache), cache_path)
+        except Exception as e:
+            logger.warning("Ignoring unreadable validation cache %s: %s", cache_path, e)
+
+    @staticmethod
+    def _cache_record(result: ValidationResult) -> dict[str, Any]:
+        # A cached result only feeds file events, which need nothing from data but the service
+        # name; the parsed document itself may hold YAML types JSON cannot encode (!!set, !!binary).
+        record = result.to_dict()
+        data = result.data
+        service = (data.get("service") or data.get("name")) if isinstance(data, dict) else None
+        record["data"] = {"service": service} if isinstance(service, (str, int, float)) else None
+        return record
+
+    def save_result_cache(self, keep: Iterable[str] | None = None) -> None:
+        validator = self._validator
+        if validator is None:
+            return
+        # Watch workers save concurrently; one snapshot-and-write at a time, so an older snapshot
+        # never replaces a newer one.
+        with self._cache_lock:
+            entries = dict(validator.result_cache)
+            if keep is not None:
+                keep = set(keep)
+                entries = {path: entry for path, entry in entries.items() if path in keep}
+                validator.result_cache = dict(entries)
+            
+            cache_path = self._cache_path()
+            tmp_path = None
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                records = {
+                    path: (mtime_ns, size, digest, self._cache_record(result))
+                    for path, (mtime_ns, size, digest, result) in entries.items()
+                }
+                fd, tmp_path = tempfile.mkstemp(prefix=cache_path.name, suffix=".tmp", dir=cache_path.parent)
+                os.close(fd)
+                write_json(tmp_path, {"key": self._cache_key(validator), "entries": records})
+                os.replace(tmp_path, cache_path)
+            except Exception as e:
+                logger.warning("Could not write validation cache %s: %s", cache_path, e)
+                if tmp_path is not None:
+                    with contextlib.suppress(OSError):
+                        os.unlink(tmp_path)
 
     @staticmethod
     def load_yaml(path: Path) -> dict[str, Any]:
         with path.open("r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=YamlLoader) or {}
 
     def discover_files(self) -> Iterable[Path]:
         self._setup_discovery()
         return self._discovery.discover_yaml_files(self.root_path)
 
     def validate_files(self, files: Iterable[Path]) -> List[ValidationResult]:
-        self._setup_validator()
+        validator = self._setup_validator()
         
-        all_results = []
+        all_results: List[ValidationResult] = []
         batch = []
         batch_count = 0
         total_files = 0
@@ -118,8 +204,7 @@ class ValidationService:
                 if total_files > 1000:
                     logger.info(f"Processing batch {batch_count} ({len(batch)} files, {total_files} total)...")
                 
-                batch_results = self._validator.validate_files_sync(file_paths)
-                all_results.extend(batch_results)
+                all_results.extend(validator.validate_many(file_paths))
                 batch = []
         
         if batch:
@@ -128,8 +213,7 @@ class ValidationService:
             if total_files > 1000:
                 logger.info(f"Processing final batch {batch_count} ({len(batch)} files, {total_files} total)...")
             
-            batch_results = self._validator.validate_files_sync(file_paths)
-            all_results.extend(batch_results)
+            all_results.extend(validator.validate_many(file_paths))
         
         if total_files == 0:
             logger.warning("No files to validate")
@@ -146,16 +230,8 @@ class ValidationService:
         sample_error = ""
         if result.errors:
             sample_error = result.errors[0][:200]
-        elif result.issues and result.issues[0].get("message"):
-            sample_error = result.issues[0]["message"][:200]
-        
-        sha256 = ""
-        if result.data:
-            try:
-                payload = json.dumps(result.data, sort_keys=True, separators=(",", ":"))
-                sha256 = hashlib.sha256(payload.encode("utf-8")).hexdigest()
-            except Exception:
-                sha256 = ""
+        elif result.issues and result.issues[0].message:
+            sample_error = result.issues[0].message[:200]
         
         event: dict[str, Any] = {
             "type": "file",
@@ -169,7 +245,7 @@ class ValidationService:
             "rule_ids": [],
             "keywords": [],
             "sample_error": sample_error,
-            "sha256": sha256,
+            "sha256": result.sha256 or "",
         }
         
         if result.issues:
@@ -177,11 +253,11 @@ class ValidationService:
             keywords = set()
             
             for issue in result.issues[:8]:
-                rule_id = issue.get("rule_id")
+                rule_id = issue.rule_id
                 if rule_id:
                     rule_ids.add(rule_id)
                 
-                for keyword in issue.get("keywords", [])[:4]:
+                for keyword in issue.keywords[:4]:
                     keywords.add(keyword)
             
             event["rule_ids"] = sorted(list(rule_ids))[:8]
@@ -189,47 +265,67 @@ class ValidationService:
         
         return event
     
-    def stream_to_ndjson(self, results: List[ValidationResult]) -> None:
-        run_id = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
-        ts = run_id
-        
-        stream_path = self.report_path / "stream.ndjson"
-        stream_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with self._write_lock:
-            new_events: list[dict[str, Any]] = []
-            for result in results:
-                event = self._create_file_event(result, run_id, ts)
-                new_events.append(event)
-            
-            existing_lines: dict[str, str] = {}
+    def _stream_path(self) -> Path:
+        return self.report_path / "stream.ndjson"
+
+    def _load_stream_events(self) -> dict[str, bytes]:
+        # Called with self._write_lock held; the existing stream is read at most once per service.
+        if self._stream_events is None:
+            self._stream_events = {}
+            stream_path = self._stream_path()
             if stream_path.exists():
-                with stream_path.open("r", encoding="utf-8") as fp:
+                with stream_path.open("rb") as fp:
                     for line in fp:
+                        line = line.strip()
                         try:
-                            existing_event = json.loads(line.strip())
+                            existing_event = loads(line)
                             path = existing_event.get("path", "")
                             if path:
-                                existing_lines[path] = line.strip()
-                        except (json.JSONDecodeError, KeyError):
+                                self._stream_events[path] = line
+                        except (ValueError, AttributeError):
                             continue
-            
-            for event in new_events:
-                path = event["path"]
-                new_line = json.dumps(event, separators=(",", ":"), ensure_ascii=False)
-                existing_lines[path] = new_line
-            
-            with stream_path.open("w", encoding="utf-8") as fp:
-                for line in existing_lines.values():
-                    fp.write(line + '\n')
-                fp.flush()
-                os.fsync(fp.fileno())
+        return self._stream_events
+
+    def stream_to_ndjson(
+        self, results: List[ValidationResult], run_id: str | None = None, ts: str | None = None
+    ) -> None:
+        if run_id is None:
+            run_id, _ = _run_timestamps()
+        ts = ts or run_id
         
-        logger.info("Updated %d events in %s (total: %d)", len(new_events), stream_path, len(existing_lines))
+        with self._write_lock:
+            events = self._load_stream_events()
+            for result in results:
+                event = self._create_file_event(result, run_id, ts)
+                events[event["path"]] = dumps(event)
+            self._stream_dirty = True
+        
+        logger.debug("Updated %d events in stream buffer (total: %d)", len(results), len(events))
+
+    def flush_stream(self, durable: bool = False) -> None:
+        """Rewrite stream.ndjson from the in-memory events; fsync only when durable is set."""
+        stream_path = self._stream_path()
+        
+        with self._write_lock:
+            if not self._stream_dirty:
+                return
+            events = self._load_stream_events()
+            stream_path.parent.mkdir(parents=True, exist_ok=True)
+            with stream_path.open("wb") as fp:
+                fp.write(b"".join(line + b"\n" for line in events.values()))
+                if durable:
+                    fp.flush()
+                    os.fsync(fp.fileno())
+            self._stream_dirty = False
+        
+        logger.info("Wrote %d events to %s", len(events), stream_path)
     
-    def generate_report(self, results: List[ValidationResult]) -> List[dict[str, Any]]:
-        run_id = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
-        ts = run_id
+    def generate_report(
+        self, results: List[ValidationResult], run_id: str | None = None, ts: str | None = None
+    ) -> List[dict[str, Any]]:
+        if run_id is None:
+            run_id, _ = _run_timestamps()
+        ts = ts or run_id
         
         file_events = []
         for result in results:
@@ -238,13 +334,13 @@ class ValidationService:
         
         return file_events
 
-    def save_report(self, report: List[dict[str, Any]]) -> None:
-        current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def save_report(self, report: List[dict[str, Any]], file_stamp: str | None = None) -> None:
+        current_time = file_stamp or _run_timestamps()[1]
         dynamic_report_path = self.report_path / f"Report{current_time}.json"
         
         try:
             dynamic_report_path.parent.mkdir(parents=True, exist_ok=True)
-            dynamic_report_path.write_text(json.dumps(report, separators=(",", ":"), ensure_ascii=False), encoding="utf-8")
+            write_json(dynamic_report_path, report)
             logger.info("Report written to %s", dynamic_report_path)
             
         except PermissionError as e:
@@ -262,16 +358,15 @@ class ValidationService:
     def _save_report_fallback(self, report: List[dict[str, Any]], current_time: str) -> None:
         fallback_path = Path.cwd() / f"Report{current_time}.json"
         try:
-            fallback_path.write_text(json.dumps(report, separators=(",", ":"), ensure_ascii=False), encoding="utf-8")
+            write_json(fallback_path, report)
             logger.info("Report written to fallback location: %s", fallback_path)
         except PermissionError as fallback_error:
             logger.error("Permission denied for fallback location %s: %s", fallback_path, fallback_error)
             
-            import tempfile
             temp_dir = Path(tempfile.gettempdir())
             temp_report_path = temp_dir / f"config-validator-report-{current_time}.json"
             try:
-                temp_report_path.write_text(json.dumps(report, separators=(",", ":"), ensure_ascii=False), encoding="utf-8")
+                write_json(temp_report_path, report)
                 logger.info("Report written to temporary location: %s", temp_report_path)
             except Exception as temp_error:
                 logger.error("Failed to write report to any location: %s", temp_error)
@@ -293,25 +388,60 @@ class ValidationService:
         print(f"  Files: {len(report)}")
 
     def run_validation(self) -> List[dict[str, Any]]:
+        run_id, file_stamp = _run_timestamps()
         files = self.discover_files()
         results = self.validate_files(files)
         
-        self.stream_to_ndjson(results)
+        self.stream_to_ndjson(results, run_id, run_id)
+        self.flush_stream(durable=True)
+        self.save_result_cache(keep=(r.path for r in results))
         
-        report = self.generate_report(results)
-        self.save_report(report)
+        report = self.generate_report(results, run_id, run_id)
+        self.save_report(report, file_stamp)
         self.print_summary(report)
         
         return report
 
     def validate_specific_files(self, file_paths: List[str]) -> List[dict[str, Any]]:
+        run_id, file_stamp = _run_timestamps()
         files = [Path(p) for p in file_paths]
         results = self.validate_files(files)
         
-        self.stream_to_ndjson(results)
+        self.stream_to_ndjson(results, run_id, run_id)
+        self.flush_stream()
+        self.save_result_cache()
         
-        report = self.generate_report(results)
-        self.save_report(report)
+        report = self.generate_report(results, run_id, run_id)
+        self.save_report(report, file_stamp)
         self.print_summary(report)
         return report
 
+    def _forget_paths(self, paths: Iterable[str]) -> None:
+        with self._write_lock:
+            events = self._load_stream_events()
+            for path in paths:
+                if events.pop(path, None) is not None:
+                    self._stream_dirty = True
+        if self._validator is not None:
+            for path in paths:
+                self._validator.result_cache.pop(path, None)
+
+    def validate_changed(self, changed: Iterable[str], deleted: Iterable[str] = ()) -> List[dict[str, Any]]:
+        """Revalidate only the files a watcher reported, instead of rescanning the whole tree."""
+        changed = list(changed)
+        deleted = set(deleted)
+        # Delete-then-recreate (git checkout, rm + cp, some editor saves) can leave a path in
+        # deleted that exists again; revalidate it rather than dropping it from the report.
+        recreated = {path for path in deleted if os.path.exists(path)}
+        if recreated:
+            deleted -= recreated
+            changed.extend(recreated.difference(changed))
+        if deleted:
+            self._forget_paths(deleted)
+        
+        if changed:
+            return self.validate_specific_files(changed)
+        
+        self.flush_stream()
+        self.save_result_cache()
+        return []
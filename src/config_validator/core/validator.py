@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, List, Tuple
+
+from ..utils.hashing import content_digest
+from .base_validator import BaseValidator, ValidationResult
+from .types import ValidationIssue
+
+logger = logging.getLogger(__name__)
+
+
+class ValidatorCore(BaseValidator):
+    """Files are validated in chunks on a shared thread pool.
+
+    Holds everything that needs no event loop. Validator adds the sync validate_file(s) API on
+    top and AsyncValidator the coroutine one, so neither overrides the other's signatures.
+    """
+
+    def __init__(
+        self,
+        config: Any,
+        storage: Any,
+        max_concurrency: int | None = None,
+        per_task_timeout: float | None = 30.0,
+        chunk_size: int = 32,
+    ) -> None:
+        super().__init__(config, storage)
+        self._max_concurrency = max_concurrency or min(32, (os.cpu_count() or 4) * 2)
+        self._timeout = per_task_timeout
+        self._chunk_size = max(1, chunk_size)
+        self._pool: Executor | None = None
+        self._pool_lock = threading.Lock()
+
+    def _new_pool(self) -> Executor:
+        return ThreadPoolExecutor(
+            max_workers=self._max_concurrency,
+            thread_name_prefix="config-validator",
+        )
+
+    def _get_pool(self) -> Executor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = self._new_pool()
+            return self._pool
+
+    def close(self) -> None:
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def validate_one(self, file_path: str) -> ValidationResult:
+        fingerprint = self._file_fingerprint(file_path)
+        cached = self._cached_result(file_path, fingerprint)
+        if cached is not None:
+            return cached
+        
+        content, errors = self._read_content(file_path)
+        digest = content_digest(content) if content is not None else None
+        entry = self.result_cache.get(file_path)
+        if digest is not None and entry is not None and entry[2] == digest:
+            # Same bytes under a new mtime (touch, checkout, no-op save): reuse the result
+            result = entry[3]
+        else:
+            result = self._validate_content(file_path, content, errors)
+        if fingerprint is not None:
+            self._store_result(file_path, fingerprint, digest, result)
+        return result
+
+    def _validate_uncached(self, file_path: str) -> ValidationResult:
+        return self._validate_content(file_path, *self._read_content(file_path))
+
+    def _validate_content(self, file_path: str, content: bytes | None, errors: List[str]) -> ValidationResult:
+        if content is not None:
+            data, errors = self._parse_content(file_path, content)
+        else:
+            data = None
+        
+        issues: List[ValidationIssue] = []
+        for err in errors:
+            issues.append(ValidationIssue(
+                rule_id="file.parse_error",
+                message=err,
+                keywords=["parse", "error"]
+            ))
+        
+        if data is None:
+            return ValidationResult(
+                path=file_path,
+                valid=False,
+                issues=issues,
+                registry=None,
+                data=None
+            )
+        return self._validate_data(file_path, data, issues)
+
+    def _validate_data(self, file_path: str, data: Any, issues: List[ValidationIssue]) -> ValidationResult:
+        registry = None
+        service = None
+        if isinstance(data, dict):
+            rule_issues = self._run_validation_rules(data, file_path)
+            issues.extend(rule_issues)
+            registry = self._extract_registry(data)
+            service = data.get("service")
+        
+        common_keys = self._common_search_keys(service, registry)
+        for issue in issues:
+            self._build_search_keys(issue, common_keys)
+        
+        return ValidationResult(
+            path=file_path,
+            valid=not issues,
+            issues=issues,
+            registry=registry,
+            data=data,
+            sha256=self._compute_sha256(data)
+        )
+
+    def _error_result(self, file_path: str, issue: ValidationIssue) -> ValidationResult:
+        return ValidationResult(
+            path=file_path,
+            valid=False,
+            issues=[issue],
+            registry=None,
+            data=None
+        )
+
+    def _validate_chunk_sync(self, file_paths: List[str], cached: bool = True) -> List[ValidationResult]:
+        validate = self.validate_one if cached else self._validate_uncached
+        results: List[ValidationResult] = []
+        for file_path in file_paths:
+            try:
+                results.append(validate(file_path))
+            except Exception as e:
+                logger.error(f"Error validating {file_path}: {e}")
+                results.append(self._error_result(file_path, ValidationIssue(
+                    rule_id="file.error",
+                    message=repr(e),
+                    keywords=["error"]
+                )))
+        return results
+
+    def _chunk_len(self, total: int) -> int:
+        # Large enough to amortize the executor hop, small enough to keep every worker busy.
+        return max(1, min(self._chunk_size, math.ceil(total / self._max_concurrency)))
+
+    def _chunk_timeout_results(self, file_paths: List[str]) -> List[ValidationResult]:
+        logger.error(f"Timeout validating {len(file_paths)} files starting at {file_paths[0]}")
+        return [
+            self._error_result(file_path, ValidationIssue(
+                rule_id="file.timeout",
+                message="TIMEOUT",
+                keywords=["timeout", "error"]
+            ))
+            for file_path in file_paths
+        ]
+
+    def _chunk_error_results(self, file_paths: List[str], e: Exception) -> List[ValidationResult]:
+        logger.error(f"Error validating {len(file_paths)} files starting at {file_paths[0]}: {e}")
+        return [
+            self._error_result(file_path, ValidationIssue(
+                rule_id="file.error",
+                message=repr(e),
+                keywords=["error"]
+            ))
+            for file_path in file_paths
+        ]
+
+    def validate_many(self, file_paths: List[str]) -> List[ValidationResult]:
+        """Validate files in input order; chunks run concurrently on the thread pool."""
+        pool = self._get_pool()
+        size = self._chunk_len(len(file_paths))
+        chunks = [file_paths[i:i + size] for i in range(0, len(file_paths), size)]
+        futures = [pool.submit(self._validate_chunk_sync, chunk) for chunk in chunks]
+        results: List[ValidationResult] = []
+        for chunk, future in zip(chunks, futures):
+            try:
+                results.extend(future.result(timeout=self._timeout or None))
+            except FuturesTimeoutError:
+                results.extend(self._chunk_timeout_results(chunk))
+            except Exception as e:
+                results.extend(self._chunk_error_results(chunk, e))
+        return results
+
+    def validate_objects(self, objects: List[Tuple[str, Any]]) -> List[ValidationResult]:
+        """Validate already-parsed documents given as (path, data) pairs, in input order.
+
+        No file is read or parsed and the result cache is not consulted; path is only used to
+        label the results. data is normalized like a parsed file (None becomes {}, a list of
+        mappings is merged) and is otherwise referenced by the results, not copied.
+        """
+        results: List[ValidationResult] = []
+        for file_path, data in objects:
+            try:
+                results.append(self._validate_data(file_path, self._normalize_document(data), []))
+            except Exception as e:
+                logger.error(f"Error validating {file_path}: {e}")
+                results.append(self._error_result(file_path, ValidationIssue(
+                    rule_id="file.error",
+                    message=repr(e),
+                    keywords=["error"]
+                )))
+        return results
+
+
+class Validator(ValidatorCore):
+    """Synchronous validator."""
+
+    def validate_file(self, file_path: str) -> ValidationResult:
+        return self.validate_one(file_path)
+
+    def validate_files(self, file_paths: List[str]) -> List[ValidationResult]:
+        return self.validate_many(file_paths)
@@ -1,19 +1,28 @@
 from __future__ import annotations
 
 import logging
+import os
+import queue
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
 from pathlib import Path
 from typing import Callable, TYPE_CHECKING
 
 from watchdog.observers import Observer
 from watchdog.events import PatternMatchingEventHandler
 
+from ..utils.hashing import RACY_WINDOW_NS, intdigest, new_hasher
+
 if TYPE_CHECKING:
     from .validation_service import ValidationService
 
 log = logging.getLogger(__name__)
 
+_HASH_CHUNK = 64 * 1024
+# Below this a single os.read is cheaper than setting up a buffered read loop
+_SMALL_FILE = 16 * 1024
+_HASH_SHARDS = 16  # power of two
+
 IGNORE_PATTERNS = [
     "**/.git/**",
     "**/__pycache__/**",
@@ -29,11 +38,36 @@ WATCH_PATTERNS = [
 ]
 
 
+def _fd_digest(fd: int, size: int, buf: bytearray) -> int:
+    """Non-cryptographic 64-bit digest of an open file.
+
+    Small files usually take a single os.read; larger ones are read into a reused buffer and
+    hashed from a memoryview, so no per-chunk bytes objects are allocated.
+    """
+    h = new_hasher()
+    if size < _SMALL_FILE:
+        data = os.read(fd, size + 1)
+        h.update(data)
+        if len(data) != size:
+            # Short read (NFS/FUSE) or the file grew after fstat: hash the rest up to EOF,
+            # as LocalStrategy.read_bytes does.
+            while chunk := os.read(fd, _HASH_CHUNK):
+                h.update(chunk)
+    else:
+        view = memoryview(buf)
+        with open(fd, "rb", buffering=0, closefd=False) as f:
+            while n := f.readinto(view):
+                h.update(view[:n])
+    return intdigest(h)
+
+
 class BatchedEventHandler(PatternMatchingEventHandler):
     def __init__(
         self,
         callback: Callable[[set[str], set[str]], None],
         debounce_ms: int = 250,
+        max_flush_ms: int = 2000,
+        coalesce_ms: int = 25,
     ):
         super().__init__(
             patterns=WATCH_PATTERNS,
@@ -41,52 +75,183 @@ class BatchedEventHandler(PatternMatchingEventHandler):
         )
         self.callback = callback
         self.debounce_ms = debounce_ms
+        self.max_flush_ms = max_flush_ms
+        self.coalesce_ms = coalesce_ms
 
         self._lock = threading.Lock()
-        self._changed_files: set[str] = set()
-        self._deleted_files: set[str] = set()
-        self._timer: threading.Timer | None = None
+        # Every live path gets a small int id; per-path state and the pending sets are keyed by
+        # id so each event hashes and compares its (long, absolute) path string only once.
+        # Ids are never reused; a deleted path's id is released once its batch is handed over.
+        self._path_ids: dict[str, int] = {}
+        self._id_paths: dict[int, str] = {}
+        self._next_id = 0
+        # Atomic editor saves fire created/modified/moved for one file within a few ms
+        self._last_event_time: dict[int, float] = {}
+        self._changed_ids: set[int] = set()
+        self._deleted_ids: set[int] = set()
+        self._last_event_ts = 0.0
+        self._batch_start_ts: float | None = None
+
+        # One long-lived debouncer instead of a new threading.Timer (and OS thread) per event
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._debounce_thread = threading.Thread(
+            target=self._debounce_loop,
+            name="config-validator-debounce",
+            daemon=True,
+        )
+        self._debounce_thread.start()
         
-        self._file_hashes: dict[str, str] = {}
+        # pid -> (trusted stat fingerprint or None, content digest), sharded so concurrent
+        # events for different files never wait on each other or on the batch lock
+        self._hash_shards: list[tuple[threading.Lock, dict[int, tuple[tuple[int, int] | None, int]]]] = [
+            (threading.Lock(), {}) for _ in range(_HASH_SHARDS)
+        ]
+        self._read_buffers = threading.local()
+
+    def _intern(self, file_path: str) -> int:
+        pid = self._path_ids.get(file_path)
+        if pid is None:
+            with self._lock:
+                pid = self._intern_locked(file_path)
+        return pid
+
+    def _intern_locked(self, file_path: str) -> int:
+        # The path is stored under its id before the id is published, so an id found on the
+        # lock-free path in _intern always resolves.
+        pid = self._path_ids.get(file_path)
+        if pid is None:
+            pid = self._next_id
+            self._next_id += 1
+            self._id_paths[pid] = file_path
+            self._path_ids[file_path] = pid
+        return pid
+
+    def _live_id(self, file_path: str, pid: int) -> int:
+        # Called with self._lock held, before pid goes into a pending set: a batch may have
+        # released it since it was looked up.
+        return pid if pid in self._id_paths else self._intern_locked(file_path)
+
+    def _read_buffer(self) -> bytearray:
+        buf = getattr(self._read_buffers, "buf", None)
+        if buf is None:
+            buf = self._read_buffers.buf = bytearray(_HASH_CHUNK)
+        return buf
 
-    def _has_file_content_changed(self, file_path: str) -> bool:
+    def _has_file_content_changed(self, file_path: str, pid: int) -> bool:
         try:
-            import hashlib
-            path = Path(file_path)
-            if not path.exists():
+            try:
+                fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            except FileNotFoundError:
                 return False
-                
-            with path.open('rb') as f:
-                current_hash = hashlib.md5(f.read()).hexdigest()
             
-            old_hash = self._file_hashes.get(file_path)
-            if old_hash != current_hash:
-                self._file_hashes[file_path] = current_hash
-                return True
-            return False
+            try:
+                # Events almost always mean a real write, so open up front: existence, size and
+                # mtime come from one fstat on the descriptor that is hashed on a miss.
+                st = os.fstat(fd)
+                fingerprint = (st.st_mtime_ns, st.st_size)
+                lock, entries = self._hash_shards[pid & (_HASH_SHARDS - 1)]
+                entry = entries.get(pid)
+                if entry is not None and entry[0] == fingerprint:
+                    return False
+                current_hash = _fd_digest(fd, st.st_size, self._read_buffer())
+            finally:
+                os.close(fd)
+            
+            trusted = fingerprint if time.time_ns() - st.st_mtime_ns > RACY_WINDOW_NS else None
+            with lock:
+                old = entries.get(pid)
+                entries[pid] = (trusted, current_hash)
+            return old is None or old[1] != current_hash
         except Exception:
             return True
 
+    def _forget_digest(self, pid: int) -> None:
+        # A recreated file must hash as new even when its bytes match the deleted one
+        lock, entries = self._hash_shards[pid & (_HASH_SHARDS - 1)]
+        with lock:
+            entries.pop(pid, None)
+
+    def _is_duplicate_event(self, pid: int) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_event_time.get(pid, float("-inf")) < self.coalesce_ms / 1000.0:
+                return True
+            if pid in self._id_paths:
+                self._last_event_time[pid] = now
+        return False
+
     def _schedule_batch_callback(self) -> None:
+        now = time.monotonic()
         with self._lock:
-            if self._timer is not None:
-                self._timer.cancel()
+            self._last_event_ts = now
+            if self._batch_start_ts is None:
+                self._batch_start_ts = now
+        self._wakeup.set()
 
-            self._timer = threading.Timer(
-                self.debounce_ms / 1000.0,
-                self._process_batch,
-            )
-            self._timer.daemon = True
-            self._timer.start()
+    def _debounce_loop(self) -> None:
+        debounce = self.debounce_ms / 1000.0
+        max_flush = self.max_flush_ms / 1000.0
+        while not self._stopped.is_set():
+            self._wakeup.clear()
+            with self._lock:
+                if self._batch_start_ts is None:
+                    timeout = None
+                else:
+                    # Quiet period elapsed, or the batch is old enough that a steady stream of
+                    # writes must not postpone it any further.
+                    due = min(self._last_event_ts + debounce, self._batch_start_ts + max_flush)
+                    timeout = due - time.monotonic()
+            
+            if timeout is None or timeout > 0:
+                self._wakeup.wait(timeout)
+                continue
+            
+            self._process_batch()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+        self._debounce_thread.join()
+
+    def dispatch_batch(self, changed: set[str], deleted: set[str]) -> None:
+        """Hand over an already-debounced batch (watchfiles backend), bypassing the debouncer."""
+        changed_pairs = []
+        for path in changed:
+            pid = self._intern(path)
+            if self._has_file_content_changed(path, pid):
+                changed_pairs.append((path, pid))
+        deleted_pairs = [(path, self._intern(path)) for path in deleted]
+        for _, pid in deleted_pairs:
+            self._forget_digest(pid)
+        with self._lock:
+            changed_ids = {self._live_id(path, pid) for path, pid in changed_pairs}
+            deleted_ids = {self._live_id(path, pid) for path, pid in deleted_pairs}
+            self._deleted_ids -= changed_ids
+            self._changed_ids |= changed_ids
+            self._changed_ids -= deleted_ids
+            self._deleted_ids |= deleted_ids
+        self._process_batch()
 
     def _process_batch(self) -> None:
         with self._lock:
-            changed = self._changed_files.copy()
-            deleted = self._deleted_files.copy()
+            changed_ids, self._changed_ids = self._changed_ids, set()
+            deleted_ids, self._deleted_ids = self._deleted_ids, set()
+            self._batch_start_ts = None
+
+            # Paths go back to strings only at the callback boundary
+            id_paths = self._id_paths
+            changed = {id_paths[pid] for pid in changed_ids}
+            deleted = {id_paths[pid] for pid in deleted_ids}
 
-            self._changed_files.clear()
-            self._deleted_files.clear()
-            self._timer = None
+            # Deleted paths give up their id and per-path state, so a long session only holds
+            # paths that still exist; a later event for the same path interns it afresh.
+            released = deleted_ids - changed_ids
+            for pid in released:
+                del self._path_ids[id_paths.pop(pid)]
+                self._last_event_time.pop(pid, None)
+        for pid in released:
+            self._forget_digest(pid)
 
         if changed or deleted:
             log.info(
@@ -96,91 +261,209 @@ class BatchedEventHandler(PatternMatchingEventHandler):
             )
             self.callback(changed, deleted)
 
+    def _on_written(self, file_path: str) -> None:
+        pid = self._intern(file_path)
+        if self._is_duplicate_event(pid):
+            # Too close to the last event to be worth hashing, but it may still be a real edit:
+            # queue the path and drop its digest so the next event compares fresh content.
+            self._forget_digest(pid)
+        elif not self._has_file_content_changed(file_path, pid):
+            return
+        with self._lock:
+            pid = self._live_id(file_path, pid)
+            self._changed_ids.add(pid)
+            self._deleted_ids.discard(pid)
+        self._schedule_batch_callback()
+
     def on_created(self, event) -> None:
         if not event.is_directory:
-            if self._has_file_content_changed(event.src_path):
-                with self._lock:
-                    self._changed_files.add(event.src_path)
-                self._schedule_batch_callback()
+            self._on_written(event.src_path)
 
     def on_modified(self, event) -> None:
         if not event.is_directory:
-            if self._has_file_content_changed(event.src_path):
-                with self._lock:
-                    self._changed_files.add(event.src_path)
-                self._schedule_batch_callback()
+            self._on_written(event.src_path)
 
     def on_moved(self, event) -> None:
         if not event.is_directory:
+            src_id = self._intern(event.src_path)
+            dest_id = self._intern(event.dest_path)
+            self._forget_digest(src_id)
+            if self._is_duplicate_event(dest_id):
+                self._forget_digest(dest_id)
+                dest_changed = True
+            else:
+                dest_changed = self._has_file_content_changed(event.dest_path, dest_id)
             with self._lock:
-                self._deleted_files.add(event.src_path)
-                if self._has_file_content_changed(event.dest_path):
-                    self._changed_files.add(event.dest_path)
+                src_id = self._live_id(event.src_path, src_id)
+                dest_id = self._live_id(event.dest_path, dest_id)
+                self._deleted_ids.add(src_id)
+                self._last_event_time.pop(src_id, None)
+                self._changed_ids.discard(src_id)
+                if dest_changed:
+                    self._changed_ids.add(dest_id)
+                    self._deleted_ids.discard(dest_id)
             self._schedule_batch_callback()
 
     def on_deleted(self, event) -> None:
         if not event.is_directory:
+            pid = self._intern(event.src_path)
+            self._forget_digest(pid)
             with self._lock:
-                self._changed_files.discard(event.src_path)
-                self._deleted_files.add(event.src_path)
+                pid = self._live_id(event.src_path, pid)
+                self._changed_ids.discard(pid)
+                self._deleted_ids.add(pid)
+                self._last_event_time.pop(pid, None)
             self._schedule_batch_callback()
 
 
+def _merge_batches(
+    changed: set[str],
+    deleted: set[str],
+    later_changed: set[str],
+    later_deleted: set[str],
+) -> None:
+    """Fold a later batch into an earlier one in place; the later event for a path wins."""
+    changed -= later_deleted
+    changed |= later_changed
+    deleted -= later_changed
+    deleted |= later_deleted
+
+
+def _batch_worker(
+    batches: queue.Queue[tuple[set[str], set[str]] | None],
+    callback: Callable[[set[str], set[str]], None],
+) -> None:
+    while True:
+        batch = batches.get()
+        if batch is None:
+            return
+        changed, deleted = batch
+        # Whatever queued up while the previous validation ran is covered by one callback
+        stop = False
+        while not stop:
+            try:
+                later = batches.get_nowait()
+            except queue.Empty:
+                break
+            if later is None:
+                stop = True
+            else:
+                _merge_batches(changed, deleted, *later)
+        try:
+            callback(changed, deleted)
+        except Exception:
+            log.exception("Watch callback failed")
+        if stop:
+            return
+
+
+def _is_yaml_path(path: str) -> bool:
+    # Case-insensitive, like the watchdog patterns and discovery
+    return path.lower().endswith((".yml", ".yaml"))
+
+
+def _watch_with_watchfiles(
+    root_path: Path,
+    event_handler: BatchedEventHandler,
+    debounce_ms: int,
+) -> None:
+    # Imported lazily: watchfiles is an optional extra and watchdog stays the default backend.
+    from watchfiles import Change, DefaultFilter, watch
+
+    class _YamlFilter(DefaultFilter):
+        def __call__(self, change: Change, path: str) -> bool:
+            return _is_yaml_path(path) and super().__call__(change, path)
+
+    # The Rust notify backend registers the whole tree in one batch and debounces on its own side.
+    for changes in watch(root_path, watch_filter=_YamlFilter(), debounce=debounce_ms, recursive=True):
+        changed: set[str] = set()
+        deleted: set[str] = set()
+        for change, path in changes:
+            if change == Change.deleted:
+                deleted.add(path)
+            else:
+                changed.add(path)
+        event_handler.dispatch_batch(changed, deleted)
+
+
 def run_watch(
     root_path: Path,
     callback: Callable[[set[str], set[str]], None],
     debounce_ms: int = 250,
     workers: int = 8,
+    backend: str = "watchdog",
 ) -> None:
     root_path = Path(root_path).resolve()
 
-    executor = ThreadPoolExecutor(max_workers=workers)
+    # Bounded, so a validation backlog blocks the debouncer instead of piling up batches in memory
+    batches: queue.Queue[tuple[set[str], set[str]] | None] = queue.Queue(maxsize=16)
+    worker_threads = [
+        threading.Thread(
+            target=_batch_worker,
+            args=(batches, callback),
+            name=f"config-validator-watch-{i}",
+            daemon=True,
+        )
+        for i in range(workers)
+    ]
+    for thread in worker_threads:
+        thread.start()
 
     def batch_callback(changed: set[str], deleted: set[str]) -> None:
-        executor.submit(callback, changed, deleted)
+        batches.put((changed, deleted))
 
     event_handler = BatchedEventHandler(
         callback=batch_callback,
         debounce_ms=debounce_ms,
     )
 
-    observer = Observer()
-    observer.schedule(event_handler, str(root_path), recursive=True)
-    observer.start()
+    observer = None
+    if backend == "watchdog":
+        observer = Observer()
+        observer.schedule(event_handler, str(root_path), recursive=True)
+        observer.start()
+    elif backend != "watchfiles":
+        raise ValueError(f"Unknown watch backend: {backend!r}")
 
-    log.info("Watching %s (recursive) ... Press Ctrl+C to stop", root_path)
+    log.info("Watching %s (recursive, %s) ... Press Ctrl+C to stop", root_path, backend)
     log.info("Listening for *.yaml and *.yml files")
 
     try:
-        while True:
-            observer.join(timeout=1)
-            if not observer.is_alive():
-                break
+        if observer is None:
+            _watch_with_watchfiles(root_path, event_handler, debounce_ms)
+        else:
+            while True:
+                observer.join(timeout=1)
+                if not observer.is_alive():
+                    break
     except KeyboardInterrupt:
         log.info("Shutting down watcher...")
-        observer.stop()
-        observer.join()
+        if observer is not None:
+            observer.stop()
+            observer.join()
+        event_handler.stop()
         log.info("Watcher stopped cleanly")
-        executor.shutdown(wait=True)
-        log.info("Thread pool executor shut down")
+        for _ in worker_threads:
+            batches.put(None)
+        for thread in worker_threads:
+            thread.join()
+        log.info("Watch workers shut down")
 
 
 def watch_with_validation_service(
     validation_service: 'ValidationService',
     debounce_ms: int = 250,
     workers: int = 8,
+    backend: str = "watchdog",
 ) -> None:
     def batch_callback(changed: set[str], deleted: set[str]) -> None:
-        if changed:
-            log.info("Validating %d changed files", len(changed))
-            validation_service.validate_specific_files(list(changed))
-        elif deleted:
-            log.info("Detected %d deleted files, running full validation", len(deleted))
-            validation_service.run_validation()
+        log.info("Validating %d changed files, dropping %d deleted files", len(changed), len(deleted))
+        validation_service.validate_changed(changed, deleted)
 
     run_watch(
         validation_service.root_path,
         batch_callback,
         debounce_ms=debounce_ms,
         workers=workers,
+        backend=backend,
     )
\ No newline at end of file
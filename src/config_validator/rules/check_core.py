@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from functools import wraps
 from typing import Any, List
 
+from ..core.rules_loader import ValidatorFn
 from ..core.types import ValidationIssue
 from ..utils.validation_checks import (
     check_required_fields,
@@ -9,6 +11,14 @@ from ..utils.validation_checks import (
     check_image_format,
     check_env_key_case,
     check_service_name,
+    ENV_KEY_CASE_TESTS,
+    env_key_case_issue,
+    env_keys_failing,
+    image_pattern_issue,
+    image_type_issue,
+    replicas_range_issue,
+    required_keys_issue,
+    service_name_issue,
 )
 
 
@@ -21,3 +31,50 @@ def validate_core(data: dict, config: Any) -> List[ValidationIssue]:
     issues.extend(check_env_key_case(data, config))
     issues.extend(check_service_name(data, config))
     return issues
+
+
+def build_core_validator(config: Any) -> ValidatorFn:
+    """Specialize validate_core for one config.
+
+    Same checks and issues as validate_core, but the config values are read once, here, into
+    closure locals and the four top-level fields are fetched once per file. The result ignores
+    the config it is called with, so later changes to config are not seen.
+    """
+    required = frozenset(config.required_fields)
+    rmin, rmax = config.replicas_min, config.replicas_max
+    image_re = config._image_re
+    env_case = config.env_key_case
+    key_test = ENV_KEY_CASE_TESTS.get(env_case)
+
+    @wraps(validate_core)
+    def validate(data: dict[str, Any], _config: Any = None) -> List[ValidationIssue]:
+        issues: List[ValidationIssue] = []
+        get = data.get
+        svc, rep, img, env = get("service"), get("replicas"), get("image"), get("env")
+
+        missing = sorted(required.difference(data))
+        if missing:
+            issues.append(required_keys_issue(missing))
+
+        if not isinstance(rep, int) or not (rmin <= rep <= rmax):
+            issues.append(replicas_range_issue(rmin, rmax))
+
+        if not isinstance(img, str):
+            issues.append(image_type_issue())
+        elif not image_re.match(img):
+            issues.append(image_pattern_issue())
+
+        if key_test is not None and isinstance(env, dict):
+            bad = env_keys_failing(env, key_test)
+            if bad:
+                issues.append(env_key_case_issue(env_case, bad))
+
+        if not isinstance(svc, str) or svc.strip() == "":
+            issues.append(service_name_issue())
+
+        return issues
+
+    return validate
+
+
+validate_core.specialize = build_core_validator  # type: ignore[attr-defined]
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+try:
+    import xxhash
+    HAVE_XXHASH = True
+except ImportError:  # optional accelerator, see the "fast" extra
+    HAVE_XXHASH = False
+
+# Filesystems with coarse mtimes (FAT, HFS+, ext3) can hide a same-size rewrite inside one
+# timestamp tick; stat fingerprints younger than this are not trusted on their own.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def new_hasher() -> Any:
+    """Streaming non-cryptographic 64-bit hasher: xxh3 when available, else 8-byte BLAKE2b."""
+    if HAVE_XXHASH:
+        return xxhash.xxh3_64()
+    return hashlib.blake2b(digest_size=8)
+
+
+def intdigest(h: Any) -> int:
+    if HAVE_XXHASH:
+        return int(h.intdigest())
+    return int.from_bytes(h.digest(), "big")
+
+
+def content_digest(data: bytes) -> int:
+    h = new_hasher()
+    h.update(data)
+    return intdigest(h)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterable
+
+from .serialization import dumps
+
+if TYPE_CHECKING:
+    from ..core.base_validator import ValidationResult
+
+
+class ReportWriter:
+    """Writes aggregated JSON reports one file entry at a time.
+
+    Entries are encoded and written as results arrive, so peak memory stays at one entry
+    rather than a fully built {"files": [...]} document. The summary is only known at the
+    end and is written after the files array.
+    """
+
+    @staticmethod
+    def file_entry(result: ValidationResult) -> Dict[str, Any]:
+        return {
+            "path": result.path,
+            "valid": result.valid,
+            "errors": result.errors,
+            "registry": result.registry,
+        }
+
+    @classmethod
+    def stream(cls, path: str | os.PathLike[str], results: Iterable[ValidationResult]) -> Dict[str, int]:
+        """Write {"files": [...], "summary": {...}} to path and return the summary."""
+        valid_count = 0
+        total_files = 0
+        with open(path, "wb") as f:
+            f.write(b'{"files":[')
+            for result in results:
+                if total_files:
+                    f.write(b",")
+                f.write(dumps(cls.file_entry(result)))
+                total_files += 1
+                if result.valid:
+                    valid_count += 1
+            summary = {
+                "valid_count": valid_count,
+                "invalid_count": total_files - valid_count,
+                "total_files": total_files,
+            }
+            f.write(b'],"summary":')
+            f.write(dumps(summary))
+            f.write(b"}")
+        return summary
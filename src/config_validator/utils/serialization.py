@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import orjson
+
+loads = orjson.loads
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes (non-string YAML keys are stringified)."""
+    option = orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, option=option)
+
+
+def write_json(path: str | os.PathLike[str], obj: Any) -> None:
+    """Write obj to path as compact JSON in a single binary write."""
+    payload = memoryview(dumps(obj))
+    # Raw descriptor: the encoded payload goes to the kernel as-is, without a BufferedWriter.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
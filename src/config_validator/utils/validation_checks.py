@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import re
 from typing import Any
 
 from ..core.types import ValidationIssue
@@ -9,94 +8,123 @@ from ..core.types import ValidationIssue
 def check_required_fields(data: dict, config: Any) -> list[ValidationIssue]:
     """Check that all required fields are present."""
     issues = []
-    required = set(config.required_fields)
-    missing = sorted(required - set(data.keys()))
+    missing = sorted(frozenset(config.required_fields).difference(data))
     if missing:
-        issues.append(ValidationIssue(
-            rule_id="schema.required_keys",
-            message=f"Missing required keys: {missing}",
-            keywords=["schema", "required"]
-        ))
+        issues.append(required_keys_issue(missing))
     return issues
 
 
+def required_keys_issue(missing: list[str]) -> ValidationIssue:
+    return ValidationIssue(
+        rule_id="schema.required_keys",
+        message=f"Missing required keys: {missing}",
+        keywords=["schema", "required"]
+    )
+
+
 def check_replicas_range(data: dict, config: Any) -> list[ValidationIssue]:
     """Check that replicas are within the configured range."""
     issues = []
     rep = data.get("replicas")
     if not isinstance(rep, int) or not (config.replicas_min <= rep <= config.replicas_max):
-        issues.append(ValidationIssue(
-            rule_id="replicas.range",
-            message=f"replicas must be an integer between {config.replicas_min} and {config.replicas_max}",
-            keywords=["replicas", "range"]
-        ))
+        issues.append(replicas_range_issue(config.replicas_min, config.replicas_max))
     return issues
 
 
+def replicas_range_issue(replicas_min: int, replicas_max: int) -> ValidationIssue:
+    return ValidationIssue(
+        rule_id="replicas.range",
+        message=f"replicas must be an integer between {replicas_min} and {replicas_max}",
+        keywords=["replicas", "range"]
+    )
+
+
 def check_image_format(data: dict, config: Any) -> list[ValidationIssue]:
     """Check that image matches the configured pattern."""
     issues = []
     img = data.get("image")
     if not isinstance(img, str):
-        issues.append(ValidationIssue(
-            rule_id="image.format",
-            message="image must be a string like registry/service:version",
-            keywords=["image", "format"]
-        ))
-    elif not re.compile(config.image_pattern).match(img):
-        issues.append(ValidationIssue(
-            rule_id="image.format",
-            message="image must match <registry>/<service>:<version>",
-            keywords=["image", "format"]
-        ))
+        issues.append(image_type_issue())
+    elif not config._image_re.match(img):
+        issues.append(image_pattern_issue())
     return issues
 
 
+def image_type_issue() -> ValidationIssue:
+    return ValidationIssue(
+        rule_id="image.format",
+        message="image must be a string like registry/service:version",
+        keywords=["image", "format"]
+    )
+
+
+def image_pattern_issue() -> ValidationIssue:
+    return ValidationIssue(
+        rule_id="image.format",
+        message="image must match <registry>/<service>:<version>",
+        keywords=["image", "format"]
+    )
+
+
+ENV_KEY_CASE_TESTS = {"UPPERCASE": str.isupper, "lowercase": str.islower}
+
+
 def check_env_key_case(data: dict, config: Any) -> list[ValidationIssue]:
     """Check that env variable keys follow the configured case."""
     issues = []
     env = data.get("env")
-    if not isinstance(env, dict):
+    key_test = ENV_KEY_CASE_TESTS.get(config.env_key_case)
+    if key_test is None or not isinstance(env, dict):
         return issues
     
-    if config.env_key_case == "UPPERCASE":
-        non_upper = [k for k in env.keys() if not (isinstance(k, str) and k.isupper())]
-        if non_upper:
-            issues.append(ValidationIssue(
-                rule_id="env.key_case",
-                message=f"env keys must be UPPERCASE: {sorted(non_upper)}",
-                keywords=["env", "case"]
-            ))
-    elif config.env_key_case == "lowercase":
-        non_lower = [k for k in env.keys() if not (isinstance(k, str) and k.islower())]
-        if non_lower:
-            issues.append(ValidationIssue(
-                rule_id="env.key_case",
-                message=f"env keys must be lowercase: {sorted(non_lower)}",
-                keywords=["env", "case"]
-            ))
+    bad = env_keys_failing(env, key_test)
+    if bad:
+        issues.append(env_key_case_issue(config.env_key_case, bad))
     return issues
 
 
+def env_keys_failing(env: dict[str, Any], key_test: Any) -> list[str]:
+    """Keys of env that are not strings passing key_test."""
+    try:
+        # Fast path for the common all-valid case: all() over map() runs the loop in C
+        if all(map(key_test, env)):
+            return []
+    except TypeError:  # non-string key
+        pass
+    return [k for k in env if not (isinstance(k, str) and key_test(k))]
+
+
+def env_key_case_issue(case: str, keys: list[str]) -> ValidationIssue:
+    return ValidationIssue(
+        rule_id="env.key_case",
+        message=f"env keys must be {case}: {sorted(keys)}",
+        keywords=["env", "case"]
+    )
+
+
 def check_service_name(data: dict, config: Any) -> list[ValidationIssue]:
     """Check that service name is not empty."""
     issues = []
     service_name = data.get("service")
     if not isinstance(service_name, str) or service_name.strip() == "":
-        issues.append(ValidationIssue(
-            rule_id="service.name_empty",
-            message="service name must be a non-empty string",
-            keywords=["service", "name", "empty"]
-        ))
+        issues.append(service_name_issue())
     return issues
 
 
+def service_name_issue() -> ValidationIssue:
+    return ValidationIssue(
+        rule_id="service.name_empty",
+        message="service name must be a non-empty string",
+        keywords=["service", "name", "empty"]
+    )
+
+
 def check_env_values(data: dict, config: Any) -> list[ValidationIssue]:
     """Check that all env values are non-empty strings."""
     issues = []
     env = data.get("env")
     if isinstance(env, dict):
-        bad = [k for k, v in env.items() if not isinstance(v, str) or v.strip() == ""]
+        bad = [k for k, v in env.items() if not isinstance(v, str) or not v or v.isspace()]
         if bad:
             issues.append(ValidationIssue(
                 rule_id="env.value_empty",
@@ -112,11 +140,11 @@ def check_database_name(data: dict, config: Any) -> list[ValidationIssue]:
     env = data.get("env")
     if isinstance(env, dict):
         forbidden = getattr(config, 'forbidden_database_name', 'test')
-        bad = [k for k, v in env.items() if k.strip() == "DATABASE_URL" and v.strip() == forbidden]
-        if bad:
+        url = env.get("DATABASE_URL")
+        if isinstance(url, str) and url.strip() == forbidden:
             issues.append(ValidationIssue(
                 rule_id="database.forbidden_name",
-                message=f"Database name cannot be '{forbidden}': {sorted(bad)}",
+                message=f"Database name cannot be '{forbidden}': ['DATABASE_URL']",
                 keywords=["database", "forbidden"]
             ))
     return issues
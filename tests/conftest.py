@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+import pytest
+
+from config_validator.core.async_validator import AsyncValidator
+from config_validator.core.config import ValidationConfig
+from config_validator.storage.local_strategy import LocalStrategy
+
+
+@pytest.fixture(scope="session")
+def validator_factory() -> Iterator[Callable[..., AsyncValidator]]:
+    """Build one AsyncValidator per distinct config for the whole session.
+
+    Calls with the same config kwargs get the same validator (rules, regexes and thread pool
+    are set up once) with its storage re-pointed at the given base path.
+    """
+    validators: Dict[Tuple[Tuple[str, Any], ...], AsyncValidator] = {}
+
+    def make(base_path: Path, **config_kwargs: Any) -> AsyncValidator:
+        key = tuple(sorted(config_kwargs.items()))
+        validator = validators.get(key)
+        if validator is None:
+            config = ValidationConfig(**config_kwargs)
+            storage = LocalStrategy({"base_path": str(base_path)})
+            validator = validators[key] = AsyncValidator(config, storage)
+        else:
+            validator.storage.config["base_path"] = str(base_path)
+            validator.storage.base_path = Path(base_path)
+        return validator
+
+    yield make
+    for validator in validators.values():
+        validator.close()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import errno
 from pathlib import Path
 
+import pytest
+
 from config_validator.core.discovery import Discovery
 from config_validator.storage.local_strategy import LocalStrategy
 
@@ -114,3 +117,29 @@ def test_discovery_with_large_directory_structure(tmp_path: Path) -> None:
     # Verify all files are YAML files
     for file_path in yaml_files:
         assert file_path.suffix.lower() in {'.yml', '.yaml'}
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_walk_propagates_scan_errors(tmp_path: Path, monkeypatch, workers: int) -> None:
+    """Both walks surface an unreadable directory instead of silently skipping its subtree."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "svc.yaml").write_text("test: data", encoding="utf-8")
+
+    scan_dir = LocalStrategy._scan_dir
+
+    def failing_scan_dir(d: str):
+        if d.endswith("b"):
+            raise OSError(errno.EIO, "I/O error", d)
+        return scan_dir(d)
+
+    monkeypatch.setattr(LocalStrategy, "_scan_dir", staticmethod(failing_scan_dir))
+    with pytest.raises(OSError):
+        list(LocalStrategy.fast_walk_parallel(tmp_path, workers))
+
+
+def test_get_yaml_files_class_level_call(tmp_path: Path) -> None:
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "svc.yaml").write_text("test: data", encoding="utf-8")
+
+    assert list(LocalStrategy.get_yaml_files(tmp_path)) == [tmp_path.resolve() / "nested" / "svc.yaml"]
+    assert list(LocalStrategy.get_yaml_files(tmp_path, workers=4)) == [tmp_path.resolve() / "nested" / "svc.yaml"]
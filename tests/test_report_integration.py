@@ -1,173 +1,125 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 import pytest
 
-from config_validator.core.async_validator import AsyncValidator
-from config_validator.core.config import ValidationConfig
-from config_validator.storage.local_strategy import LocalStrategy
+from config_validator.utils.report_writer import ReportWriter
+from config_validator.utils.serialization import dumps, loads
 
 
-def test_yaml_validation_and_report_generation(tmp_path: Path) -> None:
-    """Test complete flow: validate YAML file, generate report, and verify JSON content."""
-    # Create test YAML file
-    test_yaml = tmp_path / "test-service.yaml"
-    test_yaml.write_text(
-        """
-service: user-api
+_VALID_DATA = {
+    "service": "user-api",
+    "replicas": 3,
+    "image": "myregistry.com/user-api:1.4.2",
+    "env": {"DATABASE_URL": "postgres://db:5432/database", "REDIS_URL": "redis://cache:6379"},
+}
+
+_EMPTY_ENV_VALUE_DATA = {
+    "service": "user-api",
+    "replicas": 2,
+    "image": "myregistry.com/user-api:1.0.0",
+    "env": {"DATABASE_URL": "", "REDIS_URL": "redis://cache:6379"},
+}
+
+_AGGREGATE_FILES = [
+    ("valid1.yaml", b"""
+service: api-1
+replicas: 5
+image: registry.com/api-1:v1.0
+env:
+    KEY1: value1
+"""),
+    ("valid2.yaml", b"""
+service: api-2
 replicas: 3
-image: myregistry.com/user-api:1.4.2
+image: registry.com/api-2:v2.0
 env:
-    DATABASE_URL: postgres://db:5432/database
-    REDIS_URL: redis://cache:6379
-        """,
-        encoding="utf-8",
-    )
-    
-    # Create validation config and storage strategy
-    config = ValidationConfig(replicas_min=1, replicas_max=10)
-    storage = LocalStrategy({"base_path": str(tmp_path)})
-    validator = AsyncValidator(config, storage)
-    
-    # Validate the file
-    results = validator.validate_files_sync([str(test_yaml)])
+    KEY2: value2
+"""),
+    ("invalid1.yaml", b"""
+service: api-3
+replicas: 2
+image: registry.com/api-3:v3.0
+env:
+    KEY3: ""
+"""),
+]
+
+
+@pytest.mark.parametrize(
+    "data,expected_valid,expected_replicas,expected_rule",
+    [
+        pytest.param(_VALID_DATA, True, 3, None, id="valid"),
+        # empty DATABASE_URL
+        pytest.param(_EMPTY_ENV_VALUE_DATA, False, 2, "env.value_empty", id="empty-env-value"),
+    ],
+)
+def test_yaml_validation_and_report(
+    tmp_path: Path,
+    validator_factory,
+    data: dict,
+    expected_valid: bool,
+    expected_replicas: int,
+    expected_rule: str | None,
+) -> None:
+    """Test complete flow: validate one parsed document, generate its report, and verify JSON content."""
+    test_yaml = tmp_path / "service.yaml"
+    
+    validator = validator_factory(tmp_path, replicas_min=1, replicas_max=10)
+    
+    # Validate the parsed document; YAML parsing is covered by the aggregated report test
+    results = validator.validate_objects([(str(test_yaml), data)])
     
     # Verify validation result
     assert len(results) == 1
     result = results[0]
     assert result.path == str(test_yaml)
-    assert result.valid is True, f"Expected valid but got errors: {result.errors}"
-    assert result.errors == []
-    assert result.issues == []
+    assert result.valid is expected_valid, f"Unexpected validity, errors: {result.errors}"
     assert result.registry == "myregistry.com"
     assert result.data is not None
     assert result.data["service"] == "user-api"
-    assert result.data["replicas"] == 3
-    
-    # Generate report manually
-    report_data = {
-        "path": result.path,
-        "valid": result.valid,
-        "errors": result.errors,
-        "registry": result.registry,
-        "data": result.data
-    }
-    
-    # Save report to JSON file
-    report_file = tmp_path / "validation_report.json"
-    with report_file.open("w", encoding="utf-8") as f:
-        json.dump({"summary": {"valid": result.valid, "errors": len(result.errors)}}, f)
-    
-    # Verify report file exists
-    assert report_file.exists()
-    
-    # Read and verify JSON content
-    with report_file.open("r", encoding="utf-8") as f:
-        report_json = json.load(f)
-    
-    assert "summary" in report_json
-    assert report_json["summary"]["valid"] is True
-    assert report_json["summary"]["errors"] == 0
-
-
-def test_yaml_validation_with_errors_and_report(tmp_path: Path) -> None:
-    """Test validation of invalid YAML and verify error reporting in JSON."""
-    
-    # Create invalid YAML file (empty DATABASE_URL)
-    test_yaml = tmp_path / "invalid-service.yaml"
-    test_yaml.write_text(
-        """
-service: user-api
-replicas: 2
-image: myregistry.com/user-api:1.0.0
-env:
-    DATABASE_URL: ""
-    REDIS_URL: redis://cache:6379
-        """,
-        encoding="utf-8",
-    )
-    
-    # Create validation config and storage strategy
-    config = ValidationConfig(replicas_min=1, replicas_max=10)
-    storage = LocalStrategy({"base_path": str(tmp_path)})
-    validator = AsyncValidator(config, storage)
-    
-    # Validate the file
-    results = validator.validate_files_sync([str(test_yaml)])
-    
-    # Verify validation result has errors
-    assert len(results) == 1
-    result = results[0]
-    assert result.path == str(test_yaml)
-    assert result.valid is False
-    assert len(result.errors) > 0
-    assert len(result.issues) > 0
-    
-    # Generate and save report
-    report_file = tmp_path / "error_report.json"
+    assert result.data["replicas"] == expected_replicas
+    if expected_rule is None:
+        assert result.errors == []
+        assert result.issues == []
+    else:
+        assert len(result.errors) > 0
+        assert expected_rule in {issue.rule_id for issue in result.issues}
+    
+    # Generate report
     report_data = {
+        "summary": {"valid": result.valid, "errors": len(result.errors)},
         "path": result.path,
         "valid": result.valid,
         "errors": result.errors,
         "registry": result.registry,
     }
     
-    with report_file.open("w", encoding="utf-8") as f:
-        json.dump(report_data, f, separators=(",", ":"), ensure_ascii=False)
-
-    
-    # Verify error report
-    assert report_file.exists()
-    with report_file.open("r", encoding="utf-8") as f:
-        report_json = json.load(f)
+    # Verify the report after a JSON round-trip (in memory; no file I/O needed)
+    report_json = loads(dumps(report_data))
     
-    assert report_json["valid"] is False
-    assert len(report_json["errors"]) > 0
-    # Check that empty env value error is present
-    assert any("env" in error.lower() or "empty" in error.lower() 
-               for error in report_json["errors"])
+    assert report_json["summary"]["valid"] is expected_valid
+    assert report_json["summary"]["errors"] == len(result.errors)
+    assert report_json["valid"] is expected_valid
+    assert report_json["registry"] == "myregistry.com"
+    if expected_rule is not None:
+        assert any("env" in error or "empty" in error
+                   for error in map(str.lower, report_json["errors"]))
 
 
-def test_multiple_yaml_files_and_aggregated_report(tmp_path: Path) -> None:
+def test_multiple_yaml_files_and_aggregated_report(tmp_path: Path, validator_factory) -> None:
     """Test validation of multiple YAML files and generate aggregated report."""
     
     # Create multiple test files
-    files_data = [
-        ("valid1.yaml", """
-service: api-1
-replicas: 5
-image: registry.com/api-1:v1.0
-env:
-    KEY1: value1
-"""),
-        ("valid2.yaml", """
-service: api-2
-replicas: 3
-image: registry.com/api-2:v2.0
-env:
-    KEY2: value2
-"""),
-        ("invalid1.yaml", """
-service: api-3
-replicas: 2
-image: registry.com/api-3:v3.0
-env:
-    KEY3: ""
-"""),
-    ]
-    
     test_files = []
-    for filename, content in files_data:
+    for filename, content in _AGGREGATE_FILES:
         test_file = tmp_path / filename
-        test_file.write_text(content, encoding="utf-8")
+        test_file.write_bytes(content)
         test_files.append(test_file)
     
     # Validate all files
-    config = ValidationConfig(replicas_min=1, replicas_max=10)
-    storage = LocalStrategy({"base_path": str(tmp_path)})
-    validator = AsyncValidator(config, storage)
+    validator = validator_factory(tmp_path, replicas_min=1, replicas_max=10)
     
     file_paths = [str(f) for f in test_files]
     results = validator.validate_files_sync(file_paths)
@@ -182,35 +134,12 @@ env:
     assert valid_count == 2
     assert invalid_count == 1
     
-    # Generate aggregated report
-    report_data = {
-        "summary": {
-            "valid_count": valid_count,
-            "invalid_count": invalid_count,
-            "total_files": len(results)
-        },
-        "files": [
-            {
-                "path": r.path,
-                "valid": r.valid,
-                "errors": r.errors,
-                "registry": r.registry
-            }
-            for r in results
-        ]
-    }
-    
-    # Save report
+    # Stream the aggregated report to disk and read it back
     report_file = tmp_path / "aggregated_report.json"
-    with report_file.open("w", encoding="utf-8") as f:
-        json.dump(report_data, f, separators=(",", ":"), ensure_ascii=False)
-
-    
-    # Verify aggregated report
-    assert report_file.exists()
-    with report_file.open("r", encoding="utf-8") as f:
-        report_json = json.load(f)
+    summary = ReportWriter.stream(report_file, results)
+    report_json = loads(report_file.read_bytes())
     
+    assert report_json["summary"] == summary
     assert report_json["summary"]["valid_count"] == 2
     assert report_json["summary"]["invalid_count"] == 1
     assert report_json["summary"]["total_files"] == 3
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
-
+import asyncio
 from pathlib import Path
 
 
 from config_validator.core.async_validator import AsyncValidator
 from config_validator.core.config import ValidationConfig
+from config_validator.rules.check_core import validate_core
 from config_validator.storage.local_strategy import LocalStrategy
 
 
 
 
-def test_validate_happy_path(tmp_path: Path) -> None:
+def test_validate_happy_path(tmp_path: Path, validator_factory) -> None:
     f = tmp_path / "svc.yaml"
     f.write_text(
         """
@@ -25,10 +26,7 @@ def test_validate_happy_path(tmp_path: Path) -> None:
         encoding="utf-8",
         )
 
-    # Create test configuration and storage strategy
-    config = ValidationConfig()
-    storage = LocalStrategy({"base_path": str(tmp_path)})
-    validator = AsyncValidator(config, storage)
+    validator = validator_factory(tmp_path)
 
     res = validator.validate_files_sync([str(f)])[0]
     assert res.valid is True
@@ -38,26 +36,17 @@ def test_validate_happy_path(tmp_path: Path) -> None:
 
 
  
-def test_validate_core_errors(tmp_path: Path) -> None:
-    f = tmp_path / "bad.yaml"
-    f.write_text(
-        """
-        service: user-api
-        replicas: 2
-        image: myregistry.com/user-api:1.0.0
-        env:
-            DATABASE_URL: ""
-            REDIS_URL: redis://cache:6379
-        """,
-        encoding="utf-8",
-        )
+def test_validate_core_errors(tmp_path: Path, validator_factory) -> None:
+    data = {
+        "service": "user-api",
+        "replicas": 2,
+        "image": "myregistry.com/user-api:1.0.0",
+        "env": {"DATABASE_URL": "", "REDIS_URL": "redis://cache:6379"},
+    }
 
-    # Create test configuration and storage strategy
-    config = ValidationConfig()
-    storage = LocalStrategy({"base_path": str(tmp_path)})
-    validator = AsyncValidator(config, storage)
+    validator = validator_factory(tmp_path)
 
-    res = validator.validate_files_sync([str(f)])[0]
+    res = validator.validate_objects([(str(tmp_path / "bad.yaml"), data)])[0]
      
     assert res.valid is False
     errors = res.errors
@@ -68,4 +57,100 @@ def test_validate_core_errors(tmp_path: Path) -> None:
     assert len(issues) > 0
     # Backward compatibility: errors should match issue messages
     assert errors == [issue["message"] for issue in issues]
-  
\ No newline at end of file
+  
+
+def test_validate_with_process_pool(tmp_path: Path) -> None:
+    good = tmp_path / "svc.yaml"
+    good.write_text(
+        """
+        service: user-api
+        replicas: 3
+        image: myregistry.com/user-api:1.4.2
+        """,
+        encoding="utf-8",
+        )
+    bad = tmp_path / "bad.yaml"
+    bad.write_text("service: [\n", encoding="utf-8")
+
+    config = ValidationConfig()
+    storage = LocalStrategy({"base_path": str(tmp_path)})
+    validator = AsyncValidator(config, storage, max_concurrency=2, use_processes=True)
+    try:
+        results = validator.validate_files_sync([str(good), str(bad)])
+    finally:
+        validator.close()
+
+    assert [r.path for r in results] == [str(good), str(bad)]
+    assert results[0].valid is True
+    assert results[0].registry == "myregistry.com"
+    assert results[1].valid is False
+    assert results[1].issues[0]["rule_id"] == "file.parse_error"
+
+
+def test_validate_core_reads_config_changes() -> None:
+    config = ValidationConfig()
+    data = {"service": "user-api", "replicas": 60, "image": "myregistry.com/user-api:1.0.0"}
+    assert [issue.rule_id for issue in validate_core(data, config)] == ["replicas.range"]
+
+    config.replicas_max = 100
+    assert validate_core(data, config) == []
+
+
+def test_validate_core_reads_required_fields_changes() -> None:
+    config = ValidationConfig()
+    data = {"service": "user-api", "replicas": 2, "image": "myregistry.com/user-api:1.0.0"}
+    assert validate_core(data, config) == []
+
+    config.required_fields = [*config.required_fields, "env"]
+    assert [issue.rule_id for issue in validate_core(data, config)] == ["schema.required_keys"]
+
+
+def test_async_validator_coroutine_api(tmp_path: Path, validator_factory) -> None:
+    f = tmp_path / "svc.yaml"
+    f.write_bytes(b"service: user-api\nreplicas: 3\nimage: myregistry.com/user-api:1.4.2\n")
+
+    validator = validator_factory(tmp_path)
+
+    async def run():
+        return await validator.validate_file(str(f)), await validator.validate_files([str(f)])
+
+    one, many = asyncio.run(run())
+    assert one.valid is True
+    assert [r.path for r in many] == [str(f)]
+
+
+def test_bound_core_validator_uses_one_config_snapshot() -> None:
+    config = ValidationConfig()
+    bound = validate_core.specialize(config)
+    data = {
+        "service": "user-api",
+        "replicas": 2,
+        "image": "myregistry.com/user-api:1.0.0",
+        "env": {"database_url": "postgres://db:5432/x"},
+    }
+
+    config.env_key_case = "lowercase"
+    config.replicas_max = 1
+    assert [issue.message for issue in bound(data, config)] == [
+        "env keys must be UPPERCASE: ['database_url']"
+    ]
+
+
+def test_validate_objects_normalizes_like_parsed_files(tmp_path: Path, validator_factory) -> None:
+    empty = tmp_path / "empty.yaml"
+    empty.write_bytes(b"")
+    listed = tmp_path / "listed.yaml"
+    listed.write_bytes(b"- service: user-api\n- replicas: 3\n  image: myregistry.com/user-api:1.4.2\n")
+
+    validator = validator_factory(tmp_path)
+
+    from_files = validator.validate_files_sync([str(empty), str(listed)])
+    from_objects = validator.validate_objects([
+        (str(empty), None),
+        (str(listed), [{"service": "user-api"}, {"replicas": 3, "image": "myregistry.com/user-api:1.4.2"}]),
+    ])
+    assert [(r.valid, r.data, r.errors) for r in from_objects] == [
+        (r.valid, r.data, r.errors) for r in from_files
+    ]
+    assert from_objects[0].valid is False
+    assert from_objects[1].valid is True
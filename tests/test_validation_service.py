@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable, Iterator, List
+
+import pytest
+
+from config_validator.core.validation_service import ValidationService
+from config_validator.utils.serialization import loads
+
+
+@pytest.fixture
+def make_service(tmp_path: Path) -> Iterator[Callable[[], ValidationService]]:
+    """Build services over tmp_path/tree that share one report dir (and so one result cache)."""
+    root = tmp_path / "tree"
+    root.mkdir()
+    storage_config = tmp_path / "storage.yaml"
+    storage_config.write_text(f"type: local\nconfig:\n  base_path: {root}\n", encoding="utf-8")
+    services: List[ValidationService] = []
+
+    def make() -> ValidationService:
+        service = ValidationService(root, tmp_path / "reports", storage_config_path=storage_config)
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        service.close()
+
+
+def test_cache_ignores_racy_fingerprint_across_runs(make_service) -> None:
+    first = make_service()
+    f = first.root_path / "svc.yaml"
+    f.write_bytes(b"service: user-api\nreplicas: 3\nimage: myregistry.com/user-api:1.4.2\n")
+    st = f.stat()
+
+    [result] = first.validate_files([f])
+    assert result.valid is True
+    first.save_result_cache()
+
+    # Same size, same mtime tick: only the content tells the two versions apart
+    f.write_bytes(b"service: user-api\nreplicas: 0\nimage: myregistry.com/user-api:1.4.2\n")
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    [result] = make_service().validate_files([f])
+    assert result.valid is False
+    assert "replicas.range" in {issue.rule_id for issue in result.issues}
+
+
+def test_cache_trusts_settled_fingerprint(make_service) -> None:
+    first = make_service()
+    f = first.root_path / "svc.yaml"
+    f.write_bytes(b"service: user-api\nreplicas: 3\nimage: myregistry.com/user-api:1.4.2\n")
+    hour_ago_ns = f.stat().st_mtime_ns - 3600 * 10**9
+    os.utime(f, ns=(hour_ago_ns, hour_ago_ns))
+
+    first.validate_files([f])
+    first.save_result_cache()
+
+    second = make_service()
+    second.validate_files([f])
+    mtime_ns, size, _, cached = second._validator.result_cache[str(f)]
+    assert (mtime_ns, size) == (hour_ago_ns, f.stat().st_size)
+    assert cached.valid is True
+
+
+def test_cache_is_written_when_a_document_is_not_json_encodable(make_service) -> None:
+    first = make_service()
+    plain = first.root_path / "svc.yaml"
+    plain.write_bytes(b"service: user-api\nreplicas: 3\nimage: myregistry.com/user-api:1.4.2\n")
+    tagged = first.root_path / "tagged.yaml"
+    tagged.write_bytes(
+        b"service: tagged-api\nreplicas: 3\nimage: myregistry.com/tagged-api:1.0.0\n"
+        b"tags: !!set {a, b}\n"
+    )
+
+    first.validate_files([plain, tagged])
+    first.save_result_cache()
+
+    second = make_service()
+    second._setup_validator()
+    cache = second._validator.result_cache
+    assert set(cache) == {str(plain), str(tagged)}
+    assert cache[str(tagged)][3].data == {"service": "tagged-api"}
+    event = second._create_file_event(cache[str(tagged)][3], "run", "ts")
+    assert event["service"] == "tagged-api"
+
+
+def _stream_paths(service: ValidationService) -> set:
+    lines = (service.report_path / "stream.ndjson").read_bytes().splitlines()
+    return {loads(line)["path"] for line in lines}
+
+
+def test_validate_changed_revalidates_and_forgets(make_service) -> None:
+    service = make_service()
+    a, b = service.root_path / "a.yaml", service.root_path / "b.yaml"
+    a.write_bytes(b"service: a\nreplicas: 3\nimage: myregistry.com/a:1.0.0\n")
+    b.write_bytes(b"service: b\nreplicas: 3\nimage: myregistry.com/b:1.0.0\n")
+    service.run_validation()
+    assert _stream_paths(service) == {str(a), str(b)}
+
+    a.write_bytes(b"service: a\nreplicas: 0\nimage: myregistry.com/a:1.0.0\n")
+    b.unlink()
+    report = service.validate_changed({str(a)}, {str(b)})
+
+    assert [(entry["path"], entry["valid"]) for entry in report] == [(str(a), False)]
+    assert _stream_paths(service) == {str(a)}
+    assert str(b) not in service._validator.result_cache
+
+
+def test_validate_changed_keeps_a_deleted_path_that_exists_again(make_service) -> None:
+    service = make_service()
+    f = service.root_path / "svc.yaml"
+    f.write_bytes(b"service: svc\nreplicas: 3\nimage: myregistry.com/svc:1.0.0\n")
+    service.run_validation()
+
+    # rm + cp of identical bytes: the watcher may still hand over a delete
+    report = service.validate_changed(set(), {str(f)})
+
+    assert [entry["path"] for entry in report] == [str(f)]
+    assert _stream_paths(service) == {str(f)}
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Iterator, List, Set, Tuple
+
+import pytest
+
+from config_validator.core.watcher import (
+    BatchedEventHandler,
+    _batch_worker,
+    _fd_digest,
+    _is_yaml_path,
+    _merge_batches,
+)
+from config_validator.utils.hashing import content_digest
+
+Batch = Tuple[Set[str], Set[str]]
+
+
+def _event(path: Path, dest: Path | None = None) -> SimpleNamespace:
+    return SimpleNamespace(src_path=str(path), dest_path=str(dest), is_directory=False)
+
+
+@pytest.fixture
+def handler() -> Iterator[Tuple[BatchedEventHandler, List[Batch]]]:
+    """Handler whose debouncer never fires on its own; tests flush batches explicitly."""
+    batches: List[Batch] = []
+    h = BatchedEventHandler(lambda changed, deleted: batches.append((changed, deleted)), debounce_ms=60_000)
+    yield h, batches
+    h.stop()
+
+
+def _flush(h: BatchedEventHandler, batches: List[Batch]) -> List[Batch]:
+    h._process_batch()
+    flushed = list(batches)
+    batches.clear()
+    return flushed
+
+
+def _settle(h: BatchedEventHandler) -> None:
+    # Step out of the coalescing window so the next event is hashed
+    time.sleep(h.coalesce_ms / 1000.0 * 4)
+
+
+def test_coalesced_change_after_same_bytes_rewrite_is_reported(tmp_path: Path, handler) -> None:
+    h, batches = handler
+    f = tmp_path / "svc.yaml"
+    f.write_bytes(b"replicas: 1\n")
+    h.on_modified(_event(f))
+    assert _flush(h, batches) == [({str(f)}, set())]
+    _settle(h)
+
+    f.write_bytes(b"replicas: 1\n")  # same bytes: hashed, nothing to do
+    h.on_modified(_event(f))
+    f.write_bytes(b"replicas: 2\n")  # inside the coalescing window
+    h.on_modified(_event(f))
+
+    assert _flush(h, batches) == [({str(f)}, set())]
+
+
+def test_revert_after_coalesced_change_is_reported(tmp_path: Path, handler) -> None:
+    h, batches = handler
+    f = tmp_path / "svc.yaml"
+    f.write_bytes(b"replicas: 1\n")
+    h.on_modified(_event(f))
+    _flush(h, batches)
+    _settle(h)
+
+    f.write_bytes(b"replicas: 2\n")
+    h.on_modified(_event(f))
+    f.write_bytes(b"replicas: 3\n")  # coalesced into the previous event
+    h.on_modified(_event(f))
+    assert _flush(h, batches) == [({str(f)}, set())]
+    _settle(h)
+
+    f.write_bytes(b"replicas: 2\n")  # back to the last bytes that were hashed
+    h.on_modified(_event(f))
+    assert _flush(h, batches) == [({str(f)}, set())]
+
+
+def test_fd_digest_survives_short_reads(tmp_path: Path, monkeypatch) -> None:
+    f = tmp_path / "svc.yaml"
+    f.write_bytes(b"x" * 1000)
+    fd = os.open(f, os.O_RDONLY)
+    try:
+        expected = _fd_digest(fd, 1000, bytearray(64 * 1024))
+        os.lseek(fd, 0, os.SEEK_SET)
+        real_read = os.read
+        monkeypatch.setattr(os, "read", lambda fd, n: real_read(fd, min(n, 300)))
+        assert _fd_digest(fd, 1000, bytearray(64 * 1024)) == expected == content_digest(b"x" * 1000)
+    finally:
+        os.close(fd)
+
+
+def test_unchanged_rewrite_is_not_reported(tmp_path: Path, handler) -> None:
+    h, batches = handler
+    f = tmp_path / "svc.yaml"
+    f.write_bytes(b"replicas: 1\n")
+    h.on_modified(_event(f))
+    _flush(h, batches)
+    _settle(h)
+
+    f.write_bytes(b"replicas: 1\n")
+    h.on_modified(_event(f))
+    assert _flush(h, batches) == []
+
+
+def test_delete_then_recreate_with_same_bytes_is_a_change(tmp_path: Path, handler) -> None:
+    h, batches = handler
+    f = tmp_path / "svc.yaml"
+    f.write_bytes(b"replicas: 1\n")
+    h.on_created(_event(f))
+    _flush(h, batches)
+
+    f.unlink()
+    h.on_deleted(_event(f))
+    f.write_bytes(b"replicas: 1\n")
+    h.on_created(_event(f))
+    assert _flush(h, batches) == [({str(f)}, set())]
+
+
+def test_move_reports_source_deleted_and_destination_changed(tmp_path: Path, handler) -> None:
+    h, batches = handler
+    src, dest = tmp_path / "a.yaml", tmp_path / "b.yaml"
+    src.write_bytes(b"replicas: 1\n")
+    h.on_created(_event(src))
+    _flush(h, batches)
+
+    src.rename(dest)
+    h.on_moved(_event(src, dest))
+    assert _flush(h, batches) == [({str(dest)}, {str(src)})]
+
+
+def test_deleted_paths_release_their_state(tmp_path: Path, handler) -> None:
+    h, batches = handler
+    for i in range(50):
+        f = tmp_path / f"svc{i}.yaml"
+        f.write_bytes(b"replicas: %d\n" % i)
+        h.on_created(_event(f))
+        f.unlink()
+        h.on_deleted(_event(f))
+
+    [(changed, deleted)] = _flush(h, batches)
+    assert changed == set()
+    assert len(deleted) == 50
+    assert h._path_ids == {}
+    assert h._id_paths == {}
+    assert h._last_event_time == {}
+    assert all(not entries for _, entries in h._hash_shards)
+
+
+def test_dispatch_batch_hashes_changes_and_reports_deletes(tmp_path: Path, handler) -> None:
+    h, batches = handler
+    kept, gone = tmp_path / "kept.yaml", tmp_path / "gone.yaml"
+    kept.write_bytes(b"replicas: 1\n")
+
+    h.dispatch_batch({str(kept)}, {str(gone)})
+    h.dispatch_batch({str(kept)}, set())  # same bytes again: nothing to report
+
+    assert batches == [({str(kept)}, {str(gone)})]
+
+
+def test_debouncer_flushes_after_quiet_period(tmp_path: Path) -> None:
+    flushed = threading.Event()
+    h = BatchedEventHandler(lambda changed, deleted: flushed.set(), debounce_ms=50)
+    try:
+        f = tmp_path / "svc.yaml"
+        f.write_bytes(b"replicas: 1\n")
+        h.on_modified(_event(f))
+        assert flushed.wait(2.0)
+    finally:
+        h.stop()
+
+
+def test_debouncer_flushes_a_steady_stream_after_max_flush(tmp_path: Path) -> None:
+    flushed = threading.Event()
+    h = BatchedEventHandler(lambda changed, deleted: flushed.set(), debounce_ms=500, max_flush_ms=200)
+    try:
+        f = tmp_path / "svc.yaml"
+        deadline = time.monotonic() + 2.0
+        i = 0
+        # Events every 50 ms never leave a 500 ms quiet period; only max_flush_ms can fire
+        while not flushed.is_set() and time.monotonic() < deadline:
+            i += 1
+            f.write_bytes(b"replicas: %d\n" % i)
+            h.on_modified(_event(f))
+            time.sleep(0.05)
+        assert flushed.is_set()
+        assert i < 20
+    finally:
+        h.stop()
+
+
+def test_merge_batches_lets_the_later_event_win() -> None:
+    changed, deleted = {"a", "b"}, {"c"}
+    _merge_batches(changed, deleted, {"c"}, {"a"})
+    assert (changed, deleted) == ({"b", "c"}, {"a"})
+
+
+def test_batch_worker_merges_queued_batches() -> None:
+    batches: queue.Queue = queue.Queue(maxsize=16)
+    for batch in [({"a"}, set()), ({"b"}, {"a"}), (set(), {"c"}), None]:
+        batches.put(batch)
+    calls: List[Batch] = []
+
+    _batch_worker(batches, lambda changed, deleted: calls.append((changed, deleted)))
+
+    assert calls == [({"b"}, {"a", "c"})]
+
+
+@pytest.mark.parametrize("name", ["svc.yaml", "svc.yml", "SVC.YAML", "svc.Yml"])
+def test_watchfiles_filter_accepts_yaml_suffixes_in_any_case(name: str) -> None:
+    assert _is_yaml_path(f"/tree/{name}")
+    assert not _is_yaml_path(f"/tree/{name}.bak")